@@ -0,0 +1,72 @@
+"""
+Cells/second of the generic ``parse_value`` try-chain versus the typed
+per-field parsers, over the label/value cells of the recorded Fundamentus
+pages.
+
+    poetry run python -m benchmarks.bench_value_parsers
+"""
+
+import argparse
+from pathlib import Path
+import timeit
+
+from quantiq.modules.scrapper.providers.fundamentus.vocabulary import (
+    REIT_PARSERS,
+    REIT_VOCABULARY,
+    STOCK_PARSERS,
+    STOCK_VOCABULARY,
+)
+from quantiq.modules.scrapper.providers.page import Page
+from quantiq.modules.scrapper.providers.values import parse_value
+
+FIXTURES = Path(__file__).resolve().parent.parent / "tests" / "fixtures" / "fundamentus"
+PAGES = [
+    ("detalhes_petr4.html", STOCK_VOCABULARY, STOCK_PARSERS),
+    ("detalhes_hglg11.html", REIT_VOCABULARY, REIT_PARSERS),
+]
+
+
+def load_cells() -> list[tuple[str, str]]:
+    """(payload key, raw value) for every labelled cell of the recorded pages."""
+    cells = []
+    for name, vocabulary, _ in PAGES:
+        page = Page.from_html((FIXTURES / name).read_text(encoding="utf-8"))
+        for table in page.tables:
+            for row in table.rows:
+                for i in range(len(row) - 1):
+                    key = vocabulary.get(row[i])
+                    if key is not None:
+                        cells.append((key, row[i + 1]))
+    return cells
+
+
+def main() -> None:
+    arguments = argparse.ArgumentParser(description=__doc__)
+    arguments.add_argument("--repeat", type=int, default=5)
+    arguments.add_argument("--number", type=int, default=2000)
+    args = arguments.parse_args()
+
+    cells = load_cells()
+    parsers = {**REIT_PARSERS, **STOCK_PARSERS}
+    typed = [(parsers.get(key, parse_value), value) for key, value in cells]
+
+    def before() -> None:
+        for _, value in cells:
+            parse_value(value)
+
+    def after() -> None:
+        for parser, value in typed:
+            parser(value)
+
+    print(f"{len(cells)} cells per iteration")
+    results = {}
+    for label, fn in (("parse_value", before), ("typed parsers", after)):
+        best = min(timeit.repeat(fn, repeat=args.repeat, number=args.number))
+        results[label] = len(cells) * args.number / best
+        print(f"{label:>14}: {results[label]:>12,.0f} cells/s")
+
+    print(f"{'speedup':>14}: {results['typed parsers'] / results['parse_value']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
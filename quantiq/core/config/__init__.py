@@ -0,0 +1,15 @@
+from quantiq.core.config.settings import (
+    AssetSettings,
+    HttpSettings,
+    ScrapperSettings,
+    Settings,
+    get_settings,
+)
+
+__all__ = [
+    "AssetSettings",
+    "HttpSettings",
+    "ScrapperSettings",
+    "Settings",
+    "get_settings",
+]
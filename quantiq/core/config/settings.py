@@ -0,0 +1,170 @@
+from functools import lru_cache
+import os
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+
+def env(name: str, default: Any) -> Any:
+    """Read a ``QUANTIQ_*`` environment variable, falling back to ``default``."""
+    return os.getenv(f"QUANTIQ_{name}", default)
+
+
+class HttpSettings(BaseModel):
+    pool_connections: int = Field(
+        default_factory=lambda: env("HTTP_POOL_CONNECTIONS", 4),
+        description="Number of per-host connection pools kept by the session",
+    )
+    pool_maxsize: int = Field(
+        default_factory=lambda: env("HTTP_POOL_MAXSIZE", 16),
+        description="Maximum keep-alive connections per host",
+    )
+    max_concurrency_per_host: int = Field(
+        default_factory=lambda: env("HTTP_MAX_CONCURRENCY_PER_HOST", 16),
+        description="Maximum in-flight async requests per upstream host",
+    )
+    connect_timeout: float = Field(
+        default_factory=lambda: env("HTTP_CONNECT_TIMEOUT", 5.0),
+        description="Seconds to wait for the TCP/TLS handshake",
+    )
+    read_timeout: float = Field(
+        default_factory=lambda: env("HTTP_READ_TIMEOUT", 20.0),
+        description="Seconds to wait for the server to send a response",
+    )
+    user_agent: str = Field(
+        default_factory=lambda: env(
+            "HTTP_USER_AGENT",
+            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+        ),
+        description="User-Agent header sent to upstream providers",
+    )
+    rate_limit_enabled: bool = Field(
+        default_factory=lambda: env("HTTP_RATE_LIMIT_ENABLED", True),
+        description="Pace requests per host with an adaptive token bucket",
+    )
+    rate_limit_initial: float = Field(
+        default_factory=lambda: env("HTTP_RATE_LIMIT_INITIAL", 4.0),
+        description="Requests per second allowed to a host before any feedback",
+    )
+    rate_limit_min: float = Field(
+        default_factory=lambda: env("HTTP_RATE_LIMIT_MIN", 0.5),
+        description="Floor for the per-host rate, in requests per second",
+    )
+    rate_limit_max: float = Field(
+        default_factory=lambda: env("HTTP_RATE_LIMIT_MAX", 32.0),
+        description="Ceiling for the per-host rate, in requests per second",
+    )
+    rate_limit_burst: int = Field(
+        default_factory=lambda: env("HTTP_RATE_LIMIT_BURST", 4),
+        description="Requests a host may receive back to back after being idle",
+    )
+    rate_limit_increase: float = Field(
+        default_factory=lambda: env("HTTP_RATE_LIMIT_INCREASE", 1.0),
+        description="Additive increase of the rate, in requests/s per second of success",
+    )
+    rate_limit_decrease_factor: float = Field(
+        default_factory=lambda: env("HTTP_RATE_LIMIT_DECREASE_FACTOR", 0.5),
+        description="Multiplier applied to the rate on 429/5xx, errors or slow responses",
+    )
+    rate_limit_decrease_cooldown: float = Field(
+        default_factory=lambda: env("HTTP_RATE_LIMIT_DECREASE_COOLDOWN", 1.0),
+        description="Minimum seconds between two multiplicative decreases",
+    )
+    rate_limit_target_latency: float = Field(
+        default_factory=lambda: env("HTTP_RATE_LIMIT_TARGET_LATENCY", 2.0),
+        description="Responses slower than this many seconds count as congestion",
+    )
+    retry_max_attempts: int = Field(
+        default_factory=lambda: env("HTTP_RETRY_MAX_ATTEMPTS", 3),
+        description="Retries after the first attempt for 429/5xx and connection errors",
+    )
+    retry_backoff_base: float = Field(
+        default_factory=lambda: env("HTTP_RETRY_BACKOFF_BASE", 0.5),
+        description="Seconds of the first backoff window, doubled on every retry",
+    )
+    retry_backoff_max: float = Field(
+        default_factory=lambda: env("HTTP_RETRY_BACKOFF_MAX", 30.0),
+        description="Longest wait before a retry, Retry-After included",
+    )
+
+
+class AssetSettings(BaseModel):
+    batch_workers: int = Field(
+        default_factory=lambda: env("ASSET_BATCH_WORKERS", 8),
+        description="Concurrent scrapes used by the batch endpoint",
+    )
+    batch_max_tickers: int = Field(
+        default_factory=lambda: env("ASSET_BATCH_MAX_TICKERS", 1000),
+        description="Maximum number of tickers accepted per batch request",
+    )
+    stock_ttl_seconds: float = Field(
+        default_factory=lambda: env("ASSET_STOCK_TTL_SECONDS", 900.0),
+        description="Age after which a stored stock is refreshed from the provider",
+    )
+    reit_ttl_seconds: float = Field(
+        default_factory=lambda: env("ASSET_REIT_TTL_SECONDS", 900.0),
+        description="Age after which a stored REIT is refreshed from the provider",
+    )
+
+
+class ScrapperSettings(BaseModel):
+    html_parser: str = Field(
+        default_factory=lambda: env("SCRAPPER_HTML_PARSER", "html.parser"),
+        description="BeautifulSoup tree builder: 'html.parser' or 'lxml'",
+    )
+    parse_only_tables: bool = Field(
+        default_factory=lambda: env("SCRAPPER_PARSE_ONLY_TABLES", False),
+        description="Build only the <table> elements of a page instead of the full tree",
+    )
+    parse_workers: int = Field(
+        default_factory=lambda: env("SCRAPPER_PARSE_WORKERS", 0),
+        description="Processes used to parse pages; 0 parses in the request's process",
+    )
+    cache_ttl_seconds: float = Field(
+        default_factory=lambda: env("SCRAPPER_CACHE_TTL_SECONDS", 60.0),
+        description="Seconds an extracted payload is reused; 0 disables the cache",
+    )
+    cache_max_entries: int = Field(
+        default_factory=lambda: env("SCRAPPER_CACHE_MAX_ENTRIES", 1024),
+        description="Maximum number of extracted payloads kept in memory",
+    )
+    cache_max_bytes: int = Field(
+        default_factory=lambda: env("SCRAPPER_CACHE_MAX_BYTES", 32 * 1024 * 1024),
+        description="Maximum serialized size of the extracted payloads kept in memory",
+    )
+    breaker_failure_threshold: int = Field(
+        default_factory=lambda: env("SCRAPPER_BREAKER_FAILURE_THRESHOLD", 5),
+        description="Consecutive upstream failures that open the circuit; 0 disables it",
+    )
+    breaker_reset_timeout: float = Field(
+        default_factory=lambda: env("SCRAPPER_BREAKER_RESET_TIMEOUT", 30.0),
+        description="Seconds the circuit stays open before probing the upstream again",
+    )
+    breaker_half_open_probes: int = Field(
+        default_factory=lambda: env("SCRAPPER_BREAKER_HALF_OPEN_PROBES", 1),
+        description="Requests let through to test whether the upstream recovered",
+    )
+    archive_dir: str = Field(
+        default_factory=lambda: env("SCRAPPER_ARCHIVE_DIR", ""),
+        description="Directory, relative to the project root, where fetched pages are archived; empty disables it",
+    )
+    archive_codec: str = Field(
+        default_factory=lambda: env("SCRAPPER_ARCHIVE_CODEC", "zlib"),
+        description="Compression of archived pages: 'zlib', or 'zstd' when zstandard is installed",
+    )
+    archive_level: int = Field(
+        default_factory=lambda: env("SCRAPPER_ARCHIVE_LEVEL", 6),
+        description="Compression level of archived pages",
+    )
+
+
+class Settings(BaseModel):
+    http: HttpSettings = Field(default_factory=HttpSettings)
+    assets: AssetSettings = Field(default_factory=AssetSettings)
+    scrapper: ScrapperSettings = Field(default_factory=ScrapperSettings)
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build and cache the application settings from the environment."""
+    return Settings()
@@ -1,3 +1,5 @@
+import math
+
 from fastapi import HTTPException
 
 __all__ = ["NotFoundException", "BadRequestException"]
@@ -17,3 +19,11 @@ class BadRequestException(HTTPException):
 class ConflictException(HTTPException):
     def __init__(self, detail: dict) -> None:
         super().__init__(status_code=409, detail=detail)
+
+
+class ServiceUnavailableException(HTTPException):
+    def __init__(self, detail: dict, retry_after: float | None = None) -> None:
+        headers = None
+        if retry_after is not None:
+            headers = {"Retry-After": str(max(1, math.ceil(retry_after)))}
+        super().__init__(status_code=503, detail=detail, headers=headers)
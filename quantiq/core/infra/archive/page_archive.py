@@ -0,0 +1,244 @@
+from collections.abc import Callable, Iterator
+from datetime import UTC, datetime
+from functools import lru_cache
+import hashlib
+import logging
+import os
+from pathlib import Path
+import tempfile
+from typing import NamedTuple
+import zlib
+
+from pydantic import BaseModel
+
+from quantiq.core.config import get_settings
+from quantiq.core.infra.databases.sqlite.sqlite import Sqlite
+from quantiq.core.utils.project_root import get_project_root
+
+try:
+    import zstandard
+except ImportError:  # optional: falls back to zlib
+    zstandard = None
+
+
+class Codec(NamedTuple):
+    name: str
+    extension: str
+    compress: Callable[[bytes], bytes]
+    decompress: Callable[[bytes], bytes]
+
+
+def _codec(name: str, level: int) -> Codec | None:
+    if name == "zlib":
+        return Codec(
+            "zlib", ".zz", lambda data: zlib.compress(data, level), zlib.decompress
+        )
+    if name == "zstd" and zstandard is not None:
+        # zstandard (de)compressors must not be shared between threads
+        return Codec(
+            "zstd",
+            ".zst",
+            lambda data: zstandard.ZstdCompressor(level=level).compress(data),
+            lambda data: zstandard.ZstdDecompressor().decompress(data),
+        )
+    return None
+
+
+class ArchivedPage(BaseModel):
+    id: int
+    type: str
+    ticker: str
+    fetched_at: datetime
+    digest: str
+    codec: str
+    size: int
+    stored_size: int
+
+
+class ArchiveStats(BaseModel):
+    pages: int
+    objects: int
+    size: int
+    stored_size: int
+
+
+SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS pages (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        type TEXT NOT NULL,
+        ticker TEXT NOT NULL,
+        fetched_at TEXT NOT NULL,
+        digest TEXT NOT NULL,
+        codec TEXT NOT NULL,
+        size INTEGER NOT NULL,
+        stored_size INTEGER NOT NULL
+    );
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_pages_ticker ON pages (type, ticker, fetched_at);",
+    "CREATE INDEX IF NOT EXISTS idx_pages_digest ON pages (digest);",
+]
+
+INSERT_COLUMNS = "type, ticker, fetched_at, digest, codec, size, stored_size"
+COLUMNS = f"id, {INSERT_COLUMNS}"
+
+
+class PageArchive:
+    """
+    Compressed, content-addressed store of the raw pages fetched upstream.
+
+    Each page body is stored once, compressed, under the SHA-256 of its
+    content (``objects/ab/cdef….zz``), so fetching an unchanged page again only
+    adds a row to the index. The index (``index.db``) records every fetch by
+    type, ticker and time, which lets parsers be re-run over history without
+    touching the network. Objects are written to a temporary file and renamed
+    into place, so readers never see a partial page.
+    """
+
+    def __init__(self, root: Path | str, codec: str = "zlib", level: int = 6) -> None:
+        self.logger = logging.getLogger(__name__)
+        self.root = Path(root)
+        self.objects = self.root / "objects"
+        self.objects.mkdir(parents=True, exist_ok=True)
+
+        selected = _codec(codec, level)
+        if selected is None:
+            self.logger.warning(f"Archive codec '{codec}' unavailable, using zlib")
+            selected = _codec("zlib", level)
+        self.codec: Codec = selected  # type: ignore
+
+        self.index = Sqlite(str((self.root / "index.db").resolve()))
+        with self.index.transaction() as conn:
+            for statement in SCHEMA:
+                conn.execute(statement)
+
+    def put(
+        self,
+        type: str,
+        ticker: str,
+        html: str,
+        fetched_at: datetime | None = None,
+    ) -> ArchivedPage:
+        data = html.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        codec, stored_size = self._existing(digest)
+        if codec is None:
+            codec, stored_size = self.codec.name, self._write(digest, data)
+
+        fetched_at = fetched_at or datetime.now(UTC)
+        page_id = self.index.upsert(
+            f"INSERT INTO pages ({INSERT_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                type,
+                ticker.upper(),
+                fetched_at.isoformat(),
+                digest,
+                codec,
+                len(data),
+                stored_size,
+            ),
+        )
+        return ArchivedPage(
+            id=page_id,
+            type=type,
+            ticker=ticker.upper(),
+            fetched_at=fetched_at,
+            digest=digest,
+            codec=codec,
+            size=len(data),
+            stored_size=stored_size,
+        )
+
+    def read(self, page: ArchivedPage) -> str:
+        codec = _codec(page.codec, 0)
+        if codec is None:
+            raise ValueError(f"Archive codec '{page.codec}' is not available")
+        data = self._path(page.digest, codec).read_bytes()
+        return codec.decompress(data).decode("utf-8")
+
+    def pages(
+        self,
+        type: str | None = None,
+        tickers: list[str] | None = None,
+        latest: bool = True,
+    ) -> Iterator[ArchivedPage]:
+        """Archived fetches, oldest first; only the newest per ticker if ``latest``."""
+        conditions, params = [], []
+        if type is not None:
+            conditions.append("type = ?")
+            params.append(type)
+        if tickers:
+            conditions.append(f"ticker IN ({', '.join('?' * len(tickers))})")
+            params.extend(ticker.upper() for ticker in tickers)
+        if latest:
+            conditions.append("id IN (SELECT MAX(id) FROM pages GROUP BY type, ticker)")
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        rows = self.index.fetch_all(
+            f"SELECT {COLUMNS} FROM pages {where} ORDER BY fetched_at, id", params
+        )
+        for row in rows:
+            yield ArchivedPage(**dict(zip(COLUMNS.split(", "), row, strict=True)))
+
+    def stats(self) -> ArchiveStats:
+        row = self.index.fetch_one(
+            """
+            SELECT COUNT(*), COUNT(DISTINCT digest), COALESCE(SUM(size), 0)
+            FROM pages
+            """
+        )
+        stored = self.index.fetch_one(
+            """
+            SELECT COALESCE(SUM(stored_size), 0) FROM (
+                SELECT MAX(stored_size) AS stored_size FROM pages GROUP BY digest
+            )
+            """
+        )
+        pages, objects, size = row or (0, 0, 0)
+        return ArchiveStats(
+            pages=pages,
+            objects=objects,
+            size=size,
+            stored_size=stored[0] if stored else 0,
+        )
+
+    def _existing(self, digest: str) -> tuple[str | None, int]:
+        row = self.index.fetch_one(
+            "SELECT codec, stored_size FROM pages WHERE digest = ? LIMIT 1", (digest,)
+        )
+        if row is None:
+            return None, 0
+        codec = _codec(row[0], 0)
+        if codec is None or not self._path(digest, codec).exists():
+            return None, 0
+        return row[0], row[1]
+
+    def _write(self, digest: str, data: bytes) -> int:
+        path = self._path(digest, self.codec)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        compressed = self.codec.compress(data)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(compressed)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        return len(compressed)
+
+    def _path(self, digest: str, codec: Codec) -> Path:
+        return self.objects / digest[:2] / f"{digest[2:]}{codec.extension}"
+
+
+@lru_cache(maxsize=1)
+def get_page_archive() -> PageArchive | None:
+    """Return the configured archive, or ``None`` when archiving is disabled."""
+    settings = get_settings().scrapper
+    if not settings.archive_dir:
+        return None
+    return PageArchive(
+        get_project_root() / settings.archive_dir,
+        settings.archive_codec,
+        settings.archive_level,
+    )
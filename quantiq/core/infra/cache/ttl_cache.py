@@ -0,0 +1,165 @@
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+import pickle
+import threading
+import time
+from typing import Any
+
+from pydantic import BaseModel
+
+
+class CacheStats(BaseModel):
+    entries: int
+    bytes: int
+    max_entries: int
+    max_bytes: int
+    ttl_seconds: float
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+
+
+class CacheEntryInfo(BaseModel):
+    key: str
+    bytes: int
+    age_seconds: float
+    expires_in_seconds: float
+
+
+@dataclass(slots=True)
+class _Entry:
+    payload: bytes
+    stored_at: float
+    expires_at: float
+
+
+class TTLCache:
+    """
+    Bounded in-memory cache with per-entry TTL and LRU eviction.
+
+    Values are stored pickled: the pickle size is what counts against
+    ``max_bytes``, and every hit returns a fresh copy, so callers may mutate
+    what they get without corrupting the cache. Entries are evicted least
+    recently used first whenever either limit is exceeded, and expired entries
+    are dropped when read. All operations take a lock and are safe to call
+    from request threads and the event loop alike.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_entries: int,
+        max_bytes: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_entries > 0 and self.max_bytes > 0
+
+    def get(self, key: Hashable) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            if entry.expires_at <= self.clock():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            payload = entry.payload
+
+        return pickle.loads(payload)
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if not self.enabled:
+            return
+
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(payload) > self.max_bytes:
+            return
+
+        now = self.clock()
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = _Entry(payload, now, now + self.ttl_seconds)
+            self._bytes += len(payload)
+
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> bool:
+        with self._lock:
+            if key not in self._entries:
+                return False
+            self._remove(key)
+            return True
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        with self._lock:
+            keys = [key for key in self._entries if predicate(key)]
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def clear(self) -> int:
+        with self._lock:
+            count = len(self._entries)
+            self._entries.clear()
+            self._bytes = 0
+            return count
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                entries=len(self._entries),
+                bytes=self._bytes,
+                max_entries=self.max_entries,
+                max_bytes=self.max_bytes,
+                ttl_seconds=self.ttl_seconds,
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                expirations=self.expirations,
+            )
+
+    def entries(
+        self, format_key: Callable[[Hashable], str] = str
+    ) -> list[CacheEntryInfo]:
+        """Entries from least to most recently used."""
+        now = self.clock()
+        with self._lock:
+            return [
+                CacheEntryInfo(
+                    key=format_key(key),
+                    bytes=len(entry.payload),
+                    age_seconds=round(now - entry.stored_at, 3),
+                    expires_in_seconds=round(entry.expires_at - now, 3),
+                )
+                for key, entry in self._entries.items()
+            ]
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= len(entry.payload)
@@ -2,6 +2,7 @@ from collections.abc import Generator
 from contextlib import contextmanager
 import logging
 import sqlite3
+import threading
 from typing import Any
 
 from quantiq.core.infra.databases.tables import tables
@@ -103,6 +104,7 @@ class Sqlite:
         self.logger = logging.getLogger(__name__)
         self.db_name = db_name
         self.db_path = get_project_root() / db_name
+        self._local = threading.local()
 
     """
     Create the database.
@@ -123,37 +125,88 @@ class Sqlite:
 
     """
     Transaction context manager.
+
+    The outermost call opens a connection and a transaction that is committed
+    when the block exits cleanly and rolled back otherwise. Calls nested inside
+    it on the same thread reuse that connection through a savepoint, so a
+    failing inner block only undoes its own statements.
     """
 
     @contextmanager
     def transaction(self) -> Generator[sqlite3.Connection, None, None]:
-        conn = sqlite3.connect(self.db_path)
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        if conn is not None:
+            with self._savepoint(conn):
+                yield conn
+            return
+
+        conn = sqlite3.connect(self.db_path, isolation_level=None)
+        self._local.conn = conn
+        self._local.depth = 0
         try:
+            conn.execute("BEGIN")
             yield conn
+            conn.commit()
         except Exception as e:
             self.logger.error(f"Error in transaction: {e}")
+            conn.rollback()
             raise e
+        finally:
+            self._local.conn = None
+            conn.close()
+
+    @contextmanager
+    def _savepoint(self, conn: sqlite3.Connection) -> Generator[None, None, None]:
+        self._local.depth += 1
+        name = f"sp_{self._local.depth}"
+        conn.execute(f"SAVEPOINT {name}")
+        try:
+            yield
+        except Exception:
+            conn.execute(f"ROLLBACK TO {name}")
+            conn.execute(f"RELEASE {name}")
+            raise
+        else:
+            conn.execute(f"RELEASE {name}")
+        finally:
+            self._local.depth -= 1
+
+    """
+    Connection context manager for reads.
+
+    Reuses the connection of an enclosing transaction so reads see its
+    uncommitted writes, otherwise opens a short-lived connection.
+    """
+
+    @contextmanager
+    def connection(self) -> Generator[sqlite3.Connection, None, None]:
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        if conn is not None:
+            yield conn
+            return
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            yield conn
         finally:
             conn.close()
 
     def upsert(self, query: str, params: Any | None = None) -> int:
-        with self.transaction() as conn:
-            try:
+        try:
+            with self.transaction() as conn:
                 cursor = conn.cursor()
                 cursor.execute(query, params or {})
                 cursor.close()
-                conn.commit()
                 lastrowid = cursor.lastrowid
                 if lastrowid is None:
                     return 0
                 return lastrowid
-            except Exception as e:
-                self.logger.error(f"Error in upsert: {e}")
-                conn.rollback()
-                raise e
+        except Exception as e:
+            self.logger.error(f"Error in upsert: {e}")
+            raise e
 
     def fetch_all(self, query: str, params: Any | None = None) -> list[tuple[Any, ...]]:
-        with self.transaction() as conn:
+        with self.connection() as conn:
             cursor = conn.cursor()
             cursor.execute(query, params or {})
             return cursor.fetchall()
@@ -161,7 +214,7 @@ class Sqlite:
     def fetch_one(
         self, query: str, params: Any | None = None
     ) -> tuple[Any, ...] | None:
-        with self.transaction() as conn:
+        with self.connection() as conn:
             cursor = conn.cursor()
             cursor.execute(query, params or {})
             return cursor.fetchone()
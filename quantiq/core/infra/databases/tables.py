@@ -25,4 +25,14 @@ tables = {
             FOREIGN KEY (asset_id) REFERENCES assets (id)
         );
     """,
+    "asset_fingerprints": """
+        CREATE TABLE IF NOT EXISTS asset_fingerprints (
+            asset_id INTEGER PRIMARY KEY,
+            page_hash TEXT,
+            payload_hash TEXT NOT NULL,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (asset_id) REFERENCES assets (id)
+        );
+    """,
 }
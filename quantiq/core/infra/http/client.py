@@ -0,0 +1,215 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+import logging
+import threading
+import time
+from typing import Any
+from urllib.parse import urlsplit
+import weakref
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from quantiq.core.config import HttpSettings, get_settings
+from quantiq.core.infra.http.rate_limiter import AdaptiveTokenBucket, HostRateLimiter
+from quantiq.core.infra.http.retry import RETRY_ERRORS, RetryPolicy
+
+
+class HttpClient:
+    """
+    Shared HTTP transport for scrapper providers.
+
+    Wraps a single ``requests.Session`` whose connection pools are sized by
+    ``HttpSettings`` so every provider reuses keep-alive connections instead of
+    paying a new TCP/TLS handshake per request. The session is created lazily
+    under a lock and urllib3's pools are thread-safe, so one client can be
+    shared by all request handlers.
+
+    ``get_async`` exposes the same transport to coroutines: callers wait on a
+    per-host semaphore inside the event loop and only the requests that hold a
+    slot are handed to a small dedicated thread pool, so hundreds of pending
+    fetches cost coroutines rather than threads.
+
+    Both paths pace requests with a per-host ``HostRateLimiter`` and retry
+    throttled or failed attempts according to ``RetryPolicy``; every response
+    feeds the host's rate back. The async path waits (for tokens and backoff)
+    on the event loop, so only the attempts themselves occupy a thread.
+    """
+
+    def __init__(self, settings: HttpSettings | None = None) -> None:
+        self.logger = logging.getLogger(__name__)
+        self.settings = settings or get_settings().http
+        self._lock = threading.Lock()
+        self._session: requests.Session | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self.rate_limiter = HostRateLimiter(self.settings)
+        self.retry_policy = RetryPolicy(self.settings)
+        self._semaphores: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]
+        ] = weakref.WeakKeyDictionary()
+
+    @property
+    def timeout(self) -> tuple[float, float]:
+        return (self.settings.connect_timeout, self.settings.read_timeout)
+
+    @property
+    def session(self) -> requests.Session:
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self._build_session()
+        return self._session
+
+    def _build_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.settings.pool_connections,
+            pool_maxsize=self.settings.pool_maxsize,
+            pool_block=True,
+            max_retries=0,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update(
+            {
+                "User-Agent": self.settings.user_agent,
+                "Accept-Encoding": "gzip, deflate",
+                "Connection": "keep-alive",
+            }
+        )
+        return session
+
+    def get(
+        self,
+        url: str,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> requests.Response:
+        bucket = self._bucket(url)
+        attempt = 0
+        while True:
+            if bucket is not None:
+                time.sleep(bucket.reserve())
+            started = time.monotonic()
+            try:
+                response = self._send(url, params, headers)
+            except RETRY_ERRORS as e:
+                delay = self._on_error(bucket, e, attempt)
+            else:
+                delay = self._on_response(
+                    bucket, response, time.monotonic() - started, attempt
+                )
+                if delay is None:
+                    return response
+            self.logger.info(f"Retrying {url} in {delay:.2f}s (attempt {attempt + 1})")
+            time.sleep(delay)
+            attempt += 1
+
+    async def get_async(
+        self,
+        url: str,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> requests.Response:
+        bucket = self._bucket(url)
+        loop = asyncio.get_running_loop()
+        attempt = 0
+        while True:
+            if bucket is not None:
+                await asyncio.sleep(bucket.reserve())
+            async with self._host_semaphore(urlsplit(url).netloc):
+                started = time.monotonic()
+                try:
+                    response = await loop.run_in_executor(
+                        self.executor, partial(self._send, url, params, headers)
+                    )
+                except RETRY_ERRORS as e:
+                    delay = self._on_error(bucket, e, attempt)
+                else:
+                    delay = self._on_response(
+                        bucket, response, time.monotonic() - started, attempt
+                    )
+                    if delay is None:
+                        return response
+            self.logger.info(f"Retrying {url} in {delay:.2f}s (attempt {attempt + 1})")
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _send(
+        self,
+        url: str,
+        params: dict[str, Any] | None,
+        headers: dict[str, str] | None,
+    ) -> requests.Response:
+        return self.session.get(
+            url, params=params, headers=headers, timeout=self.timeout
+        )
+
+    def _bucket(self, url: str) -> AdaptiveTokenBucket | None:
+        if not self.rate_limiter.enabled:
+            return None
+        return self.rate_limiter.bucket(urlsplit(url).netloc)
+
+    def _on_error(
+        self, bucket: AdaptiveTokenBucket | None, error: Exception, attempt: int
+    ) -> float:
+        """Backoff before retrying a dropped or timed out attempt."""
+        if bucket is not None:
+            bucket.on_congestion()
+        if not self.retry_policy.can_retry(attempt):
+            raise error
+        return self.retry_policy.delay(attempt)
+
+    def _on_response(
+        self,
+        bucket: AdaptiveTokenBucket | None,
+        response: requests.Response,
+        latency: float,
+        attempt: int,
+    ) -> float | None:
+        """Feed ``response`` back to the limiter; the backoff if it must be retried."""
+        if not self.retry_policy.is_retryable(response):
+            if bucket is not None:
+                bucket.on_success(latency)
+            return None
+
+        if bucket is not None:
+            bucket.on_congestion()
+        if not self.retry_policy.can_retry(attempt):
+            return None
+        response.close()
+        return self.retry_policy.delay(attempt, response)
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.settings.pool_maxsize,
+                        thread_name_prefix="quantiq-http",
+                    )
+        return self._executor
+
+    def _host_semaphore(self, host: str) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphores = self._semaphores.setdefault(loop, {})
+        if host not in semaphores:
+            semaphores[host] = asyncio.Semaphore(self.settings.max_concurrency_per_host)
+        return semaphores[host]
+
+    def close(self) -> None:
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+
+
+@lru_cache(maxsize=1)
+def get_http_client() -> HttpClient:
+    """Return the process-wide HTTP client shared by every provider."""
+    return HttpClient()
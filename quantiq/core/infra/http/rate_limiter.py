@@ -0,0 +1,94 @@
+from collections.abc import Callable
+import threading
+import time
+
+from quantiq.core.config import HttpSettings
+
+
+class AdaptiveTokenBucket:
+    """
+    Token bucket whose refill rate follows AIMD, like TCP congestion control.
+
+    Every request takes a token; when the bucket is empty ``reserve`` returns
+    how long the caller must wait for its turn, so concurrent callers are
+    spaced out instead of bursting. Each fast, successful response raises the
+    rate additively (by about ``rate_increase`` requests/s per second of
+    traffic) and each throttled, failed or slow response cuts it
+    multiplicatively. Cuts are applied at most once per ``decrease_cooldown``
+    so a burst of 429s answering requests sent at the old rate counts as a
+    single congestion signal. The rate converges on the highest one the
+    upstream tolerates.
+    """
+
+    def __init__(
+        self, settings: HttpSettings, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.settings = settings
+        self.clock = clock
+        self.rate = settings.rate_limit_initial
+        self._lock = threading.Lock()
+        self._tokens = float(settings.rate_limit_burst)
+        self._refilled_at = clock()
+        self._decreased_at = float("-inf")
+
+    def reserve(self) -> float:
+        """Take a token and return the seconds to wait before using it."""
+        with self._lock:
+            now = self.clock()
+            self._tokens = min(
+                float(self.settings.rate_limit_burst),
+                self._tokens + (now - self._refilled_at) * self.rate,
+            )
+            self._refilled_at = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def on_success(self, latency: float) -> None:
+        if latency > self.settings.rate_limit_target_latency:
+            self.on_congestion()
+            return
+
+        with self._lock:
+            self.rate = min(
+                self.settings.rate_limit_max,
+                self.rate + self.settings.rate_limit_increase / self.rate,
+            )
+
+    def on_congestion(self) -> None:
+        with self._lock:
+            now = self.clock()
+            if now - self._decreased_at < self.settings.rate_limit_decrease_cooldown:
+                return
+            self._decreased_at = now
+            self.rate = max(
+                self.settings.rate_limit_min,
+                self.rate * self.settings.rate_limit_decrease_factor,
+            )
+
+
+class HostRateLimiter:
+    """One ``AdaptiveTokenBucket`` per upstream host, created on first use."""
+
+    def __init__(
+        self, settings: HttpSettings, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.settings = settings
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._buckets: dict[str, AdaptiveTokenBucket] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.settings.rate_limit_enabled
+
+    def bucket(self, host: str) -> AdaptiveTokenBucket:
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = AdaptiveTokenBucket(self.settings, self.clock)
+            return self._buckets[host]
+
+    def rates(self) -> dict[str, float]:
+        with self._lock:
+            return {host: bucket.rate for host, bucket in self._buckets.items()}
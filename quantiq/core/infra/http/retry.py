@@ -0,0 +1,83 @@
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+import random
+
+import requests
+
+from quantiq.core.config import HttpSettings
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+RETRY_ERRORS = (requests.ConnectionError, requests.Timeout)
+
+
+def is_upstream_failure(error: BaseException) -> bool:
+    """
+    Whether ``error``, or any exception it was raised from, means the upstream
+    is unreachable or unhealthy, as opposed to answering "not found".
+    """
+    seen: set[int] = set()
+    current: BaseException | None = error
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        if isinstance(current, RETRY_ERRORS):
+            return True
+        if isinstance(current, requests.HTTPError) and current.response is not None:
+            return current.response.status_code in RETRY_STATUSES
+        current = current.__cause__ or current.__context__
+    return False
+
+
+class RetryPolicy:
+    """
+    Decides whether a failed fetch is retried and how long to wait first.
+
+    Throttling (429) and transient server errors (5xx) are retried, as are
+    dropped connections and timeouts. Waits use "full jitter" exponential
+    backoff, so clients that failed together don't retry together, unless the
+    upstream says when to come back with ``Retry-After``.
+    """
+
+    def __init__(
+        self, settings: HttpSettings, rng: random.Random | None = None
+    ) -> None:
+        self.settings = settings
+        self.rng = rng or random.Random()
+
+    def can_retry(self, attempt: int) -> bool:
+        return attempt < self.settings.retry_max_attempts
+
+    @staticmethod
+    def is_retryable(response: requests.Response) -> bool:
+        return response.status_code in RETRY_STATUSES
+
+    def delay(self, attempt: int, response: requests.Response | None = None) -> float:
+        """Seconds to wait before retry number ``attempt + 1``."""
+        if response is not None:
+            retry_after = self.retry_after(response)
+            if retry_after is not None:
+                return min(retry_after, self.settings.retry_backoff_max)
+
+        ceiling = min(
+            self.settings.retry_backoff_max,
+            self.settings.retry_backoff_base * 2**attempt,
+        )
+        return self.rng.uniform(0, ceiling)
+
+    @staticmethod
+    def retry_after(response: requests.Response) -> float | None:
+        """Parse ``Retry-After`` given either as seconds or as an HTTP date."""
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=UTC)
+        return max(0.0, (when - datetime.now(UTC)).total_seconds())
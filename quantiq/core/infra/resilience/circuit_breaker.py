@@ -0,0 +1,165 @@
+from collections.abc import Awaitable, Callable
+from enum import StrEnum
+import threading
+import time
+from typing import TypeVar
+
+from pydantic import BaseModel
+
+from quantiq.core.errors import ServiceUnavailableException
+
+T = TypeVar("T")
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreakerStats(BaseModel):
+    name: str
+    state: CircuitState
+    failures: int
+    retry_in_seconds: float
+
+
+class CircuitOpenError(ServiceUnavailableException):
+    def __init__(self, name: str, retry_after: float) -> None:
+        super().__init__(
+            detail={"message": f"{name} is unavailable, try again later"},
+            retry_after=retry_after,
+        )
+
+
+class CircuitBreaker:
+    """
+    Fails fast while a dependency keeps failing, instead of queueing on it.
+
+    ``failure_threshold`` consecutive failures open the circuit: calls raise
+    ``CircuitOpenError`` straight away for ``reset_timeout`` seconds. After
+    that the circuit is half-open and lets ``half_open_probes`` calls through;
+    one success closes it again, one failure re-opens it for another
+    ``reset_timeout``. Only errors accepted by ``is_failure`` count; others
+    (e.g. an unknown ticker) mean the dependency answered and count as success.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int,
+        reset_timeout: float,
+        half_open_probes: int = 1,
+        is_failure: Callable[[BaseException], bool] = lambda _: True,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_probes = half_open_probes
+        self.is_failure = is_failure
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.failure_threshold > 0
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            return self._current_state()
+
+    def call(self, fn: Callable[[], T]) -> T:
+        self.before_call()
+        try:
+            result = fn()
+        except Exception as e:
+            self.after_error(e)
+            raise
+        except BaseException:
+            self._release_probe()
+            raise
+        self.on_success()
+        return result
+
+    async def call_async(self, fn: Callable[[], Awaitable[T]]) -> T:
+        self.before_call()
+        try:
+            result = await fn()
+        except Exception as e:
+            self.after_error(e)
+            raise
+        except BaseException:
+            self._release_probe()
+            raise
+        self.on_success()
+        return result
+
+    def before_call(self) -> None:
+        """Admit a call or raise ``CircuitOpenError``."""
+        with self._lock:
+            state = self._current_state()
+            if state == CircuitState.CLOSED:
+                return
+            if state == CircuitState.HALF_OPEN and self._probes < self.half_open_probes:
+                self._state = CircuitState.HALF_OPEN
+                self._probes += 1
+                return
+            retry_after = self._retry_in()
+        raise CircuitOpenError(self.name, retry_after)
+
+    def after_error(self, error: BaseException) -> None:
+        if self.is_failure(error):
+            self.on_failure()
+        else:
+            self.on_success()
+
+    def on_success(self) -> None:
+        with self._lock:
+            self._state = CircuitState.CLOSED
+            self._failures = 0
+            self._probes = 0
+
+    def on_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if (
+                self._state == CircuitState.HALF_OPEN
+                or self._failures >= self.failure_threshold
+            ):
+                self._state = CircuitState.OPEN
+                self._opened_at = self.clock()
+                self._probes = 0
+
+    def _release_probe(self) -> None:
+        # A cancelled call says nothing about the dependency's health.
+        with self._lock:
+            if self._state == CircuitState.HALF_OPEN and self._probes > 0:
+                self._probes -= 1
+
+    def stats(self) -> CircuitBreakerStats:
+        with self._lock:
+            return CircuitBreakerStats(
+                name=self.name,
+                state=self._current_state(),
+                failures=self._failures,
+                retry_in_seconds=round(self._retry_in(), 3),
+            )
+
+    def _current_state(self) -> CircuitState:
+        if (
+            self._state == CircuitState.OPEN
+            and self.clock() - self._opened_at >= self.reset_timeout
+        ):
+            return CircuitState.HALF_OPEN
+        return self._state
+
+    def _retry_in(self) -> float:
+        if self._state != CircuitState.OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self.reset_timeout - self.clock())
@@ -0,0 +1,16 @@
+import hashlib
+import json
+from typing import Any
+
+
+def content_hash(text: str) -> str:
+    """SHA-256 of a raw page, as stored in the fingerprints and the archive."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def payload_hash(data: Any) -> str:
+    """SHA-256 of a payload normalized to canonical JSON (sorted keys)."""
+    normalized = json.dumps(
+        data, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+    )
+    return content_hash(normalized)
@@ -4,19 +4,33 @@ from typing import Any
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from quantiq.core.config import get_settings
+from quantiq.core.infra.archive.page_archive import get_page_archive
+from quantiq.core.infra.cache.ttl_cache import TTLCache
 from quantiq.core.infra.databases.sqlite.sqlite import Sqlite
+from quantiq.core.infra.http.client import get_http_client
+from quantiq.core.infra.http.retry import is_upstream_failure
+from quantiq.core.infra.resilience.circuit_breaker import CircuitBreaker
+from quantiq.modules.admin.controllers.admin_controllers import AdminController
+from quantiq.modules.admin.manager.admin_manager import AdminManager
 from quantiq.modules.assets.controllers.asset_controllers import AssetController
 from quantiq.modules.assets.manager.asset_manager import AssetManager
 from quantiq.modules.assets.repositories.asset_details_repository import (
     AssetDetailsRepository,
 )
+from quantiq.modules.assets.repositories.asset_fingerprint_repository import (
+    AssetFingerprintRepository,
+)
 from quantiq.modules.assets.repositories.asset_repository import AssetRepository
 from quantiq.modules.assets.services.asset_details_service import AssetDetailsService
 from quantiq.modules.assets.services.asset_service import AssetService
+from quantiq.modules.scrapper.providers.fundamentus.data import AssetType
 from quantiq.modules.scrapper.providers.fundamentus.extractor import (
     FundamentusREITExtractor,
+    FundamentusScreenerExtractor,
     FundamentusStockExtractor,
 )
+from quantiq.modules.scrapper.providers.parse_pool import get_parse_pool
 from quantiq.modules.scrapper.strategies.extractor import ExtractorStrategy
 
 logger = logging.getLogger(__name__)
@@ -48,20 +62,59 @@ async def startup_event() -> None:
     extractor = ExtractorStrategy()
     extractor.set_strategy(FundamentusStockExtractor())
     extractor.set_strategy(FundamentusREITExtractor())
+    extractor.set_bulk_strategy(FundamentusScreenerExtractor(AssetType.STOCK))
+    extractor.set_bulk_strategy(FundamentusScreenerExtractor(AssetType.REIT))
+    scrapper_settings = get_settings().scrapper
+    if scrapper_settings.parse_workers > 0:
+        get_parse_pool().warm_up()
+        extractor.set_parse_pool(get_parse_pool())
+    extraction_cache = TTLCache(
+        scrapper_settings.cache_ttl_seconds,
+        scrapper_settings.cache_max_entries,
+        scrapper_settings.cache_max_bytes,
+    )
+    extractor.set_cache(extraction_cache)
+    extractor.set_archive(get_page_archive())
+    extractor.set_circuit_breaker(
+        CircuitBreaker(
+            "Fundamentus",
+            scrapper_settings.breaker_failure_threshold,
+            scrapper_settings.breaker_reset_timeout,
+            scrapper_settings.breaker_half_open_probes,
+            is_failure=is_upstream_failure,
+        )
+    )
     asset_service = AssetService(
-        AssetRepository(database), AssetDetailsService(AssetDetailsRepository(database))
+        AssetRepository(database),
+        AssetDetailsService(AssetDetailsRepository(database)),
+        AssetFingerprintRepository(database),
     )
     asset_manager = AssetManager(extractor, asset_service)
     asset_controller = AssetController(asset_manager)
 
+    admin_manager = AdminManager(extraction_cache)
+    admin_controller = AdminController(admin_manager)
+
     app.include_router(asset_controller)
+    app.include_router(admin_controller)
+
+
+@app.on_event("shutdown")  # type: ignore
+async def shutdown_event() -> None:
+    get_http_client().close()
+    get_parse_pool().close()
 
 
 @app.get("/")  # type: ignore
 async def root() -> dict[str, Any]:
     return {
         "message": "Welcome to Quantiq API",
-        "endpoints": {"/stocks/{ticker}": "Get stock data for a given ticker"},
+        "endpoints": {
+            "/assets/{ticker}": "Get asset data for a given ticker",
+            "/assets/batch": "Fetch and store several tickers in one request",
+            "/assets/refresh": "Refresh every listed asset of a type at once",
+            "/admin/cache": "Inspect or invalidate the extraction cache",
+        },
     }
 
 
@@ -97,69 +150,3 @@ async def root() -> dict[str, Any]:
 #         stock_repository.delete(ticker)
 #     except Exception as e:
 #         raise HTTPException(status_code=404, detail=str(e))
-
-# class StockBatch(BaseModel):
-#     tickers: list[str]
-
-# class REITBatch(BaseModel):
-#     tickers: list[str]
-
-# @app.post("/stocks/batch")
-# async def get_multiple_stocks(body: StockBatch):
-#     results = []
-#     errors = []
-
-#     for ticker in body.tickers:
-#         try:
-#             data = stock_scraper.scrape(ticker)
-#             data["basic_info"]["tipo"] = "stock"  # Add type field for regular stocks
-
-#             stored = stock_repository.store(data["basic_info"])
-#             details = financial_info_repository.store(data["last_financial_info"], stored["id"])
-#             market_values = market_values_repository.store(data["market_values"], stored["id"])
-#             variations = variations_repository.store(data["variations"], stored["id"])
-#             indicators = indicator_repository.store(data["indicators"], stored["id"])
-#             balance_sheets = balance_sheets_repository.store(data["balance_sheet"], stored["id"])
-#             financial_results = financial_results_repository.store(data["financial_results"], stored["id"])
-
-#             results.append({
-#                 "ticker": ticker,
-#                 "status": "success",
-#                 "data": data
-#             })
-#         except Exception as e:
-#             errors.append({
-#                 "ticker": ticker,
-#                 "status": "error",
-#                 "error": str(e)
-#             })
-
-#     return {
-#         "results": results,
-#         "errors": errors
-#     }
-
-# @app.post("/reits/batch")
-# async def get_multiple_reits(body: REITBatch):
-#     results = []
-#     errors = []
-
-#     for ticker in body.tickers:
-#         try:
-#             data = reit_scraper.scrape(ticker)
-#             results.append({
-#                 "ticker": ticker,
-#                 "status": "success",
-#                 "data": data
-#             })
-#         except Exception as e:
-#             errors.append({
-#                 "ticker": ticker,
-#                 "status": "error",
-#                 "error": str(e)
-#             })
-
-#     return {
-#         "results": results,
-#         "errors": errors
-#     }
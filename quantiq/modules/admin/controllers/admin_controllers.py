@@ -0,0 +1,27 @@
+from fastapi import APIRouter
+
+from quantiq.modules.admin.domains.cache import (
+    CacheInvalidationResponse,
+    CacheResponse,
+)
+from quantiq.modules.admin.manager.admin_manager import AdminManager
+from quantiq.modules.scrapper.providers.fundamentus.data import AssetType
+
+
+class AdminController(APIRouter):
+    def __init__(self, service: AdminManager):
+        super().__init__(prefix="/admin", tags=["admin"])
+        self.service = service
+        self.register_routes()
+
+    async def get_cache(self) -> CacheResponse:
+        return self.service.get_cache()
+
+    async def invalidate_cache(
+        self, type: AssetType | None = None, ticker: str | None = None
+    ) -> CacheInvalidationResponse:
+        return self.service.invalidate_cache(type, ticker)
+
+    def register_routes(self) -> None:
+        self.add_api_route("/cache", self.get_cache, methods=["GET"])
+        self.add_api_route("/cache", self.invalidate_cache, methods=["DELETE"])
@@ -0,0 +1,14 @@
+from pydantic import BaseModel, Field
+
+from quantiq.core.infra.cache.ttl_cache import CacheEntryInfo, CacheStats
+
+
+class CacheResponse(BaseModel):
+    stats: CacheStats
+    entries: list[CacheEntryInfo] = Field(
+        default_factory=list, description="Cached payloads, least recently used first"
+    )
+
+
+class CacheInvalidationResponse(BaseModel):
+    invalidated: int = Field(description="Number of entries removed from the cache")
@@ -0,0 +1,39 @@
+from collections.abc import Hashable
+
+from quantiq.core.infra.cache.ttl_cache import TTLCache
+from quantiq.modules.admin.domains.cache import (
+    CacheInvalidationResponse,
+    CacheResponse,
+)
+from quantiq.modules.scrapper.providers.fundamentus.data import AssetType
+
+
+class AdminManager:
+    def __init__(self, extraction_cache: TTLCache):
+        self.extraction_cache = extraction_cache
+
+    def get_cache(self) -> CacheResponse:
+        return CacheResponse(
+            stats=self.extraction_cache.stats(),
+            entries=self.extraction_cache.entries(self._format_key),
+        )
+
+    def invalidate_cache(
+        self, type: AssetType | None = None, ticker: str | None = None
+    ) -> CacheInvalidationResponse:
+        """Drop the cached payloads matching ``type`` and/or ``ticker`` (all if neither)."""
+        ticker = ticker.upper() if ticker else None
+
+        def matches(key: Hashable) -> bool:
+            key_type, key_ticker = key  # type: ignore
+            return (type is None or key_type == type) and (
+                ticker is None or key_ticker == ticker
+            )
+
+        return CacheInvalidationResponse(
+            invalidated=self.extraction_cache.invalidate_where(matches)
+        )
+
+    def _format_key(self, key: Hashable) -> str:
+        type, ticker = key  # type: ignore
+        return f"{type.value}:{ticker}"
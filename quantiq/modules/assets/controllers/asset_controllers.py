@@ -1,7 +1,10 @@
 from fastapi import APIRouter
 
 from quantiq.modules.assets.domains.assets import Asset
+from quantiq.modules.assets.domains.batch import AssetBatchRequest, AssetBatchResponse
+from quantiq.modules.assets.domains.universe import AssetUniverseResponse
 from quantiq.modules.assets.manager.asset_manager import AssetManager
+from quantiq.modules.scrapper.providers.fundamentus.data import AssetType
 
 
 class AssetController(APIRouter):
@@ -10,9 +13,19 @@ class AssetController(APIRouter):
         self.service = service
         self.register_routes()
 
-    def get_asset(self, ticker: str) -> Asset:
-        asset = self.service.create_asset(ticker)
+    async def get_asset(self, ticker: str) -> Asset:
+        asset = await self.service.get_asset_async(ticker)
         return asset
 
+    async def create_assets(self, body: AssetBatchRequest) -> AssetBatchResponse:
+        return await self.service.create_assets_async(body.tickers)
+
+    async def refresh_universe(
+        self, type: AssetType = AssetType.STOCK
+    ) -> AssetUniverseResponse:
+        return await self.service.refresh_universe_async(type)
+
     def register_routes(self) -> None:
+        self.add_api_route("/batch", self.create_assets, methods=["POST"])
+        self.add_api_route("/refresh", self.refresh_universe, methods=["POST"])
         self.add_api_route("/{ticker}", self.get_asset, methods=["GET"])
@@ -14,6 +14,10 @@ class Asset(Base):
     asset_details: AssetDetails | None = Field(
         description="Asset details of the asset", default=None
     )
+    stale: bool = Field(
+        description="Whether the data is older than its TTL or the provider is down",
+        default=False,
+    )
 
     class Config:
         extra = "ignore"
@@ -0,0 +1,21 @@
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+from quantiq.modules.assets.domains.assets import Asset
+
+
+class AssetBatchRequest(BaseModel):
+    tickers: list[str] = Field(description="Tickers to fetch", min_length=1)
+
+
+class AssetBatchResult(BaseModel):
+    ticker: str = Field(description="Ticker of the asset")
+    status: Literal["success", "error"] = Field(description="Outcome for the ticker")
+    data: Asset | None = Field(description="Persisted asset", default=None)
+    error: str | None = Field(description="Reason the ticker failed", default=None)
+
+
+class AssetBatchResponse(BaseModel):
+    results: list[AssetBatchResult] = Field(default_factory=list)
+    errors: list[AssetBatchResult] = Field(default_factory=list)
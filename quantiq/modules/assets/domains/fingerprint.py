@@ -0,0 +1,11 @@
+from pydantic import Field
+
+from quantiq.core.domain.base import Base
+
+
+class AssetFingerprint(Base):
+    asset_id: int = Field(description="Asset ID of the fingerprinted asset")
+    page_hash: str | None = Field(
+        description="SHA-256 of the raw page last stored", default=None
+    )
+    payload_hash: str = Field(description="SHA-256 of the normalized payload stored")
@@ -0,0 +1,13 @@
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from quantiq.modules.scrapper.providers.fundamentus.data import AssetType
+
+
+class AssetUniverseResponse(BaseModel):
+    type: AssetType = Field(description="Type of the refreshed assets")
+    count: int = Field(description="Number of assets listed by the provider")
+    data: list[dict[str, Any]] = Field(
+        description="Screener payload of every listed asset", default_factory=list
+    )
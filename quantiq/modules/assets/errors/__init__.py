@@ -4,3 +4,10 @@ from quantiq.core.errors import BadRequestException
 class AssetNotInsertedError(BadRequestException):
     def __init__(self, message: str = "Asset not inserted"):
         super().__init__(detail={"message": message})
+
+
+class AssetBatchTooLargeError(BadRequestException):
+    def __init__(self, size: int, limit: int):
+        super().__init__(
+            detail={"message": f"Batch of {size} tickers exceeds the limit of {limit}"}
+        )
@@ -1,22 +1,177 @@
+import asyncio
+from datetime import UTC, datetime
+from typing import Any
+
+from quantiq.core.config import AssetSettings, get_settings
+from quantiq.core.infra.concurrency.single_flight import SingleFlight
+from quantiq.core.infra.http.retry import is_upstream_failure
+from quantiq.core.infra.resilience.circuit_breaker import CircuitOpenError
+from quantiq.core.logging.base_logger import get_logger
 from quantiq.modules.assets.domains.assets import Asset
+from quantiq.modules.assets.domains.batch import AssetBatchResponse, AssetBatchResult
+from quantiq.modules.assets.domains.universe import AssetUniverseResponse
+from quantiq.modules.assets.errors import AssetBatchTooLargeError
 from quantiq.modules.assets.services.asset_service import AssetService
 from quantiq.modules.scrapper.providers.fundamentus.data import AssetType
 from quantiq.modules.scrapper.strategies.extractor import ExtractorStrategy
 
 
 class AssetManager:
-    def __init__(self, extractor: ExtractorStrategy, asset_service: AssetService):
+    def __init__(
+        self,
+        extractor: ExtractorStrategy,
+        asset_service: AssetService,
+        settings: AssetSettings | None = None,
+    ):
         self.extractor = extractor
         self.asset_service = asset_service
+        self.settings = settings or get_settings().assets
+        self.logger = get_logger(__name__)
+        self._revalidating: dict[str, asyncio.Task[None]] = {}
+        self._flights = SingleFlight()
 
     def get_asset(self, ticker: str) -> Asset:
         asset = self.asset_service.get_asset_by_ticker(ticker)
         return asset
 
+    async def get_asset_async(self, ticker: str) -> Asset:
+        """
+        Read-through lookup: serve the stored asset while it is fresh, scrape it
+        on first sight and, for stale rows, answer with what is stored while a
+        background task refreshes it (stale-while-revalidate). When the provider
+        is down, whatever is stored is served flagged as ``stale``.
+        """
+        asset = await asyncio.to_thread(self.asset_service.find_asset, ticker)
+        # Tickers only registered from a screener listing have no details yet
+        if asset is None or asset.asset_details is None:
+            try:
+                return await self.create_asset_async(ticker)
+            except Exception as e:
+                if asset is None or not self.is_provider_unavailable(e):
+                    raise
+                self.logger.warning(f"Serving stored {ticker} as stale: {e!s}")
+                asset.stale = True
+                return asset
+
+        if not self.is_fresh(asset):
+            asset.stale = True
+            self._revalidate(ticker)
+        return asset
+
+    @staticmethod
+    def is_provider_unavailable(error: Exception) -> bool:
+        return isinstance(error, CircuitOpenError) or is_upstream_failure(error)
+
+    def is_fresh(self, asset: Asset) -> bool:
+        if asset.updated_at is None:
+            return False
+
+        updated_at = asset.updated_at
+        if updated_at.tzinfo is None:
+            updated_at = updated_at.replace(tzinfo=UTC)
+        age = (datetime.now(UTC) - updated_at).total_seconds()
+        return age < self._ttl(asset.type)
+
+    def _ttl(self, type: AssetType) -> float:
+        if type == AssetType.REIT:
+            return self.settings.reit_ttl_seconds
+        return self.settings.stock_ttl_seconds
+
+    def _revalidate(self, ticker: str) -> None:
+        if ticker in self._revalidating:
+            return
+
+        task = asyncio.create_task(self._refresh(ticker))
+        self._revalidating[ticker] = task
+        task.add_done_callback(lambda _: self._revalidating.pop(ticker, None))
+
+    async def _refresh(self, ticker: str) -> None:
+        try:
+            await self.create_asset_async(ticker)
+        except Exception as e:
+            self.logger.warning(f"Background refresh of {ticker} failed: {e!s}")
+
     def create_asset(self, ticker: str) -> Asset:
-        data = self.extractor.execute(AssetType.STOCK, ticker)
-        asset = self.asset_service.insert_asset(data)
+        """Scrape and persist ``ticker``; concurrent calls share one run."""
+        return self._flights.do(
+            ticker.upper(), lambda: self._scrape_and_persist(ticker)
+        )
+
+    async def create_asset_async(self, ticker: str) -> Asset:
+        return await self._flights.do_async(
+            ticker.upper(), lambda: self._scrape_and_persist_async(ticker)
+        )
+
+    def _scrape_and_persist(self, ticker: str) -> Asset:
+        fingerprint = self.asset_service.get_fingerprint(ticker)
+        result = self.extractor.execute_if_changed(
+            AssetType.STOCK, ticker, fingerprint.page_hash if fingerprint else None
+        )
+        if result.data is None:
+            return self.asset_service.touch_asset(ticker)
+
+        asset = self.asset_service.insert_asset(result.data, result.page_hash)
+        if not asset:
+            raise ValueError("Asset not found")
+
+        return asset
+
+    async def _scrape_and_persist_async(self, ticker: str) -> Asset:
+        fingerprint = await asyncio.to_thread(
+            self.asset_service.get_fingerprint, ticker
+        )
+        result = await self.extractor.execute_if_changed_async(
+            AssetType.STOCK, ticker, fingerprint.page_hash if fingerprint else None
+        )
+        if result.data is None:
+            return await asyncio.to_thread(self.asset_service.touch_asset, ticker)
+
+        asset = await asyncio.to_thread(
+            self.asset_service.insert_asset, result.data, result.page_hash
+        )
         if not asset:
             raise ValueError("Asset not found")
 
         return asset
+
+    async def create_assets_async(self, tickers: list[str]) -> AssetBatchResponse:
+        tickers = list(dict.fromkeys(tickers))
+        if len(tickers) > self.settings.batch_max_tickers:
+            raise AssetBatchTooLargeError(len(tickers), self.settings.batch_max_tickers)
+
+        semaphore = asyncio.Semaphore(self.settings.batch_workers)
+
+        async def scrape(ticker: str) -> dict[str, Any] | Exception:
+            async with semaphore:
+                try:
+                    return await self.extractor.execute_async(AssetType.STOCK, ticker)
+                except Exception as e:
+                    return e
+
+        scraped = dict(
+            zip(tickers, await asyncio.gather(*map(scrape, tickers)), strict=True)
+        )
+        payloads = [data for data in scraped.values() if isinstance(data, dict)]
+        persisted = await asyncio.to_thread(self.asset_service.insert_assets, payloads)
+
+        response = AssetBatchResponse()
+        for ticker, data in scraped.items():
+            outcome = persisted.get(data["ticker"]) if isinstance(data, dict) else data
+            if isinstance(outcome, Asset):
+                response.results.append(
+                    AssetBatchResult(ticker=ticker, status="success", data=outcome)
+                )
+            else:
+                response.errors.append(
+                    AssetBatchResult(ticker=ticker, status="error", error=str(outcome))
+                )
+        return response
+
+    async def refresh_universe_async(self, type: AssetType) -> AssetUniverseResponse:
+        entries = await self.extractor.execute_all_async(type)
+        count = await asyncio.to_thread(
+            self.asset_service.upsert_universe, type, list(entries)
+        )
+        return AssetUniverseResponse(
+            type=type, count=count, data=list(entries.values())
+        )
@@ -0,0 +1,40 @@
+from quantiq.core.infra.databases.sqlite.sqlite import Sqlite
+from quantiq.modules.assets.domains.fingerprint import AssetFingerprint
+
+
+class AssetFingerprintRepository:
+    def __init__(self, db: Sqlite):
+        self.db = db
+
+    def get_by_ticker(self, ticker: str) -> AssetFingerprint | None:
+        query = """
+            SELECT f.asset_id, f.page_hash, f.payload_hash
+            FROM asset_fingerprints f
+            INNER JOIN assets a ON f.asset_id = a.id
+            WHERE a.ticker = :ticker
+        """
+        data = self.db.fetch_one(query, {"ticker": ticker})
+        if data:
+            (asset_id, page_hash, payload_hash) = data
+            return AssetFingerprint(
+                asset_id=int(asset_id), page_hash=page_hash, payload_hash=payload_hash
+            )
+        return None
+
+    def upsert(self, data: AssetFingerprint) -> None:
+        query = """
+            INSERT INTO asset_fingerprints (asset_id, page_hash, payload_hash)
+            VALUES (:asset_id, :page_hash, :payload_hash)
+            ON CONFLICT(asset_id) DO UPDATE SET
+                page_hash = excluded.page_hash,
+                payload_hash = excluded.payload_hash,
+                updated_at = CURRENT_TIMESTAMP
+        """
+        self.db.upsert(
+            query,
+            {
+                "asset_id": data.asset_id,
+                "page_hash": data.page_hash,
+                "payload_hash": data.payload_hash,
+            },
+        )
@@ -43,3 +43,16 @@ class AssetRepository:
         except Exception as e:
             self.logger.error(f"Error inserting asset: {e}")
             raise e
+
+    def touch(self, asset_id: int) -> None:
+        """Mark a stored asset as refreshed from the provider just now."""
+        query = "UPDATE assets SET updated_at = CURRENT_TIMESTAMP WHERE id = ?"
+        self.db.upsert(query, (asset_id,))
+
+    def upsert_ticker(self, ticker: str, type: AssetType) -> int:
+        """Register a ticker seen in a bulk listing, keeping any stored name."""
+        query = """
+            INSERT INTO assets (ticker, name, type) VALUES (?, ?, ?)
+            ON CONFLICT(ticker) DO UPDATE SET type = excluded.type
+        """
+        return self.db.upsert(query, (ticker, ticker, type.value))
@@ -1,9 +1,15 @@
 from typing import Any
 
 from quantiq.core.errors import NotFoundException
+from quantiq.core.utils.fingerprint import payload_hash
 from quantiq.modules.assets.domains.assets import Asset, AssetDetails
+from quantiq.modules.assets.domains.fingerprint import AssetFingerprint
+from quantiq.modules.assets.repositories.asset_fingerprint_repository import (
+    AssetFingerprintRepository,
+)
 from quantiq.modules.assets.repositories.asset_repository import AssetRepository
 from quantiq.modules.assets.services.asset_details_service import AssetDetailsService
+from quantiq.modules.scrapper.providers.fundamentus.data import AssetType
 
 
 class AssetNotFoundError(NotFoundException):
@@ -16,9 +22,14 @@ class AssetService:
         self,
         asset_repository: AssetRepository,
         asset_details_service: AssetDetailsService,
+        asset_fingerprint_repository: AssetFingerprintRepository | None = None,
     ):
         self.asset_repository = asset_repository
         self.asset_details_service = asset_details_service
+        self.asset_fingerprint_repository = (
+            asset_fingerprint_repository
+            or AssetFingerprintRepository(asset_repository.db)
+        )
 
     def get_asset_by_ticker(self, ticker: str) -> Asset:
         asset = self.asset_repository.get_by_ticker(ticker)
@@ -26,9 +37,49 @@ class AssetService:
             raise AssetNotFoundError(ticker)
         return asset
 
-    def insert_asset(self, data: dict[str, Any]) -> Asset:
+    def find_asset(self, ticker: str) -> Asset | None:
+        """Stored asset with its latest details, or ``None`` if never scraped."""
+        asset = self.asset_repository.get_by_ticker(ticker)
+        if asset is not None:
+            asset.asset_details = (
+                self.asset_details_service.get_asset_details_by_ticker(ticker)
+            )
+        return asset
+
+    def get_fingerprint(self, ticker: str) -> AssetFingerprint | None:
+        return self.asset_fingerprint_repository.get_by_ticker(ticker)
+
+    def touch_asset(self, ticker: str) -> Asset:
+        """Record a refresh that found nothing new: only ``updated_at`` moves."""
+        asset = self.find_asset(ticker)
+        if asset is None or asset.id is None:
+            raise AssetNotFoundError(ticker)
+        self.asset_repository.touch(asset.id)
+        return asset
+
+    def insert_asset(self, data: dict[str, Any], page_hash: str | None = None) -> Asset:
+        """
+        Store a scraped payload. Payloads identical to the last one stored (by
+        normalized hash) only bump ``updated_at`` instead of writing details.
+        """
+        digest = payload_hash(data)
         asset = self.asset_repository.get_by_ticker(data["ticker"])
 
+        if asset and asset.id is not None:
+            self.asset_repository.touch(asset.id)
+            fingerprint = self.asset_fingerprint_repository.get_by_ticker(
+                data["ticker"]
+            )
+            if fingerprint and fingerprint.payload_hash == digest:
+                if fingerprint.page_hash != page_hash:
+                    self._fingerprint(asset.id, page_hash, digest)
+                asset.asset_details = (
+                    self.asset_details_service.get_asset_details_by_ticker(
+                        data["ticker"]
+                    )
+                )
+                return asset
+
         if not asset:
             asset = self.asset_repository.insert(
                 Asset(
@@ -55,5 +106,41 @@ class AssetService:
             data["ticker"], asset_details
         )
         asset.asset_details = details
+        if asset.id is not None:
+            self._fingerprint(asset.id, page_hash, digest)
 
         return asset
+
+    def _fingerprint(self, asset_id: int, page_hash: str | None, digest: str) -> None:
+        self.asset_fingerprint_repository.upsert(
+            AssetFingerprint(
+                asset_id=asset_id, page_hash=page_hash, payload_hash=digest
+            )
+        )
+
+    def insert_assets(self, data: list[dict[str, Any]]) -> dict[str, Asset | Exception]:
+        """
+        Persist several scraped payloads in a single transaction.
+
+        Each payload is written inside its own savepoint, so a failing ticker is
+        reported in the result without discarding the others.
+        """
+        results: dict[str, Asset | Exception] = {}
+        with self.asset_repository.db.transaction():
+            for item in data:
+                results[item["ticker"]] = self._try_insert_asset(item)
+        return results
+
+    def _try_insert_asset(self, data: dict[str, Any]) -> Asset | Exception:
+        try:
+            with self.asset_repository.db.transaction():
+                return self.insert_asset(data)
+        except Exception as e:
+            return e
+
+    def upsert_universe(self, type: AssetType, tickers: list[str]) -> int:
+        """Register every listed ticker of a type in a single transaction."""
+        with self.asset_repository.db.transaction():
+            for ticker in tickers:
+                self.asset_repository.upsert_ticker(ticker, type)
+        return len(tickers)
@@ -131,19 +131,27 @@ class Indicators(Base):
 
 
 class ReitIndicators(Base):
-    ffo_yield: float = Field(alias="ffo_yield", description="FFO Yield (%)")
-    ffo_per_share: float = Field(alias="ffo_cota", description="FFO per Share")
+    ffo_yield: float | None = Field(
+        alias="ffo_yield", description="FFO Yield (%)", default=None
+    )
+    ffo_per_share: float | None = Field(
+        alias="ffo_cota", description="FFO per Share", default=None
+    )
 
     # Dividend Metrics
-    dividend_yield: float = Field(alias="div_yield", description="Dividend Yield (%)")
-    dividend_per_share: float = Field(
-        alias="dividendo_cota", description="Dividend per Share"
+    dividend_yield: float | None = Field(
+        alias="div_yield", description="Dividend Yield (%)", default=None
+    )
+    dividend_per_share: float | None = Field(
+        alias="dividendo_cota", description="Dividend per Share", default=None
     )
 
     # Valuation Metrics
-    pb_ratio: float = Field(alias="p_vp", description="Price-to-Book ratio")
-    book_value_per_share: float = Field(
-        alias="vp_cota", description="Book Value per Share"
+    pb_ratio: float | None = Field(
+        alias="p_vp", description="Price-to-Book ratio", default=None
+    )
+    book_value_per_share: float | None = Field(
+        alias="vp_cota", description="Book Value per Share", default=None
     )
 
     model_config = ConfigDict(populate_by_name=True, extra="ignore")
@@ -358,3 +366,33 @@ class StockDetails(Details):
         return cls(
             **data,
         )
+
+
+class ScreenerEntry(Base):
+    """A single row of the Fundamentus screener (``resultado.php`` pages)"""
+
+    ticker: str = Field(alias="papel")
+    price: float | None = Field(alias="cotacao", default=None)
+    avg_volume_2m: float | None = Field(alias="vol_med_2m", default=None)
+
+    model_config = ConfigDict(populate_by_name=True, extra="ignore")
+
+
+class StockScreenerEntry(ScreenerEntry):
+    shareholders_equity: float | None = Field(alias="patrim_liquido", default=None)
+    indicators: StockIndicators = Field(alias="indicators")
+
+    @classmethod
+    def create(cls, data: dict[str, Any]) -> "StockScreenerEntry":
+        return cls(**data, indicators=data)
+
+
+class REITScreenerEntry(ScreenerEntry):
+    segment: str | None = Field(alias="segmento", default=None)
+    market_value: int | None = Field(alias="valor_de_mercado", default=None)
+    indicators: ReitIndicators = Field(alias="indicators")
+    property_metrics: PropertyMetrics = Field(alias="market_values")
+
+    @classmethod
+    def create(cls, data: dict[str, Any]) -> "REITScreenerEntry":
+        return cls(**data, indicators=data, market_values=data)
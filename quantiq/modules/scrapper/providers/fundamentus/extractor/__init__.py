@@ -1,8 +1,15 @@
 from quantiq.modules.scrapper.providers.fundamentus.extractor.reit_extractor import (
     FundamentusREITExtractor,
 )
+from quantiq.modules.scrapper.providers.fundamentus.extractor.screener_extractor import (
+    FundamentusScreenerExtractor,
+)
 from quantiq.modules.scrapper.providers.fundamentus.extractor.stock_extractor import (
     FundamentusStockExtractor,
 )
 
-__all__ = ["FundamentusStockExtractor", "FundamentusREITExtractor"]
+__all__ = [
+    "FundamentusREITExtractor",
+    "FundamentusScreenerExtractor",
+    "FundamentusStockExtractor",
+]
@@ -5,37 +5,42 @@ import logging
 import re
 from typing import Any
 
-from bs4 import BeautifulSoup
-import requests
-
+from quantiq.core.infra.http.client import HttpClient
 from quantiq.modules.scrapper.providers.fundamentus.data import AssetType, REITDetails
+from quantiq.modules.scrapper.providers.fundamentus.vocabulary import (
+    REIT_PARSERS,
+    REIT_VOCABULARY,
+)
+from quantiq.modules.scrapper.providers.page import Page
+from quantiq.modules.scrapper.providers.parser import HtmlParser
 from quantiq.modules.scrapper.providers.scrapper import Scrapper
 
 logger = logging.getLogger(__name__)
 
 
 class FundamentusREITExtractor(Scrapper):
-    def __init__(self) -> None:
-        super().__init__(AssetType.REIT)
+    labels = REIT_VOCABULARY
+    parsers = REIT_PARSERS
+
+    def __init__(
+        self,
+        http_client: HttpClient | None = None,
+        html_parser: HtmlParser | None = None,
+    ) -> None:
+        super().__init__(AssetType.REIT, http_client, html_parser)
         self.base_url = "https://www.fundamentus.com.br/detalhes.php"
-        self.headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-        }
 
-    def _extract_basic_info(self, soup: BeautifulSoup) -> dict[str, Any]:
+    def _extract_basic_info(self, page: Page) -> dict[str, Any]:
         """Extrai a tabela principal de informações básicas e cotação."""
-        table = soup.find_all("table")[0]
-        rows = table.find_all("tr")  # type: ignore
         basic_info = {}
         cotacao_info = {}
-        for row in rows:
-            cols = row.find_all(["td", "th"])  # type: ignore
+        for cols in page.table(0):
             if len(cols) == 4:
-                k1, v1, k2, v2 = (c.get_text(strip=True) for c in cols)
+                k1, v1, k2, v2 = cols
                 k1 = self._format_key(k1)
                 k2 = self._format_key(k2)
                 if k1:
-                    basic_info[k1] = self._parse_value(v1)
+                    basic_info[k1] = self._parse_field(k1, v1)
                 if k2 in [
                     "cotacao",
                     "data_ult_cot",
@@ -43,9 +48,9 @@ class FundamentusREITExtractor(Scrapper):
                     "max_52_sem",
                     "vol_med_2m",
                 ]:
-                    cotacao_info[k2] = self._parse_value(v2)
+                    cotacao_info[k2] = self._parse_field(k2, v2)
             elif len(cols) == 2:
-                k, v = (c.get_text(strip=True) for c in cols)
+                k, v = cols
                 k = self._format_key(k)
                 if k in [
                     "cotacao",
@@ -54,69 +59,53 @@ class FundamentusREITExtractor(Scrapper):
                     "max_52_sem",
                     "vol_med_2m",
                 ]:
-                    cotacao_info[k] = self._parse_value(v)
+                    cotacao_info[k] = self._parse_field(k, v)
                 else:
-                    basic_info[k] = self._parse_value(v)
+                    basic_info[k] = self._parse_field(k, v)
         basic_info["tipo"] = "reit"
         if cotacao_info:
             basic_info["cotacao"] = cotacao_info
         return basic_info
 
-    def _extract_oscilations(self, soup):
+    def _extract_oscilations(self, page: Page) -> dict[str, Any]:
         """Extrai a coluna de Oscilações da tabela correspondente."""
-        # Procura a tabela que contém 'Oscilações' no cabeçalho
-        for table in soup.find_all("table"):
-            header = table.find("tr")
-            if header and "Oscilações" in header.get_text():
-                rows = table.find_all("tr")[1:]  # pula o cabeçalho
-                oscilations = {}
-                for row in rows:
-                    cols = row.find_all(["td", "th"])  # type: ignore
-                    if len(cols) >= 2:
-                        k = self._format_key(cols[0].get_text(strip=True))
-                        v = self._parse_value(cols[1].get_text(strip=True))
-                        if k:
-                            oscilations[k] = v
-                return oscilations
-        return {}
-
-    def _extract_indicadores(self, soup):
+        oscilations = {}
+        for cols in page.rows("Oscilações")[1:]:  # pula o cabeçalho
+            if len(cols) >= 2:
+                k = self._format_key(cols[0])
+                v = self._parse_field(k, cols[1])
+                if k:
+                    oscilations[k] = v
+        return oscilations
+
+    def _extract_indicadores(self, page: Page) -> dict[str, Any]:
         """Extrai os indicadores (lado direito da tabela Indicadores) de forma simples."""
-        for table in soup.find_all("table"):
-            header = table.find("tr")
-            if header and "Indicadores" in header.get_text():
-                indicadores = {}
-                for tr in table.find_all("tr"):
-                    cells = [
-                        cell.get_text(strip=True)
-                        for cell in tr.find_all(["th", "td"])  # type: ignore
-                    ]
-                    if len(cells) >= 4:
-                        key = cells[2]
-                        val = cells[3]
-                        key = self._format_key(key)
-                        with contextlib.suppress(Exception):
-                            val = self._parse_value(val)
-                        indicadores[key] = val
-                return indicadores
-        return {}
+        indicadores = {}
+        for cells in page.rows("Indicadores"):
+            if len(cells) >= 4:
+                key = self._format_key(cells[2])
+                val = cells[3]
+                with contextlib.suppress(Exception):
+                    val = self._parse_field(key, val)
+                indicadores[key] = val
+        return indicadores
 
     def oscillations_to_dict(self, rows: list[list[str]]) -> dict:
         oscillations = {}
         indicators = {}
         for r in rows[1:4]:
             period = self._format_key(r[0])
-            oscillations[period] = self._parse_value(r[1])
+            oscillations[period] = self._parse_field(period, r[1])
             for i in range(2, len(r), 2):
                 name = self._format_key(r[i])
-                val = self._parse_value(r[i + 1])
+                val = self._parse_field(name, r[i + 1])
                 indicators[name] = val
 
         raw = rows[4]
         for i, cell in enumerate(raw):
             if cell == "12 meses" or re.match(r"^\d{4}$", cell):
                 period = self._format_key(cell)
-                oscillations[period] = self._parse_value(raw[i + 1])
+                oscillations[period] = self._parse_field(period, raw[i + 1])
 
         metrics_rows = [
             r for r in rows[5:] if len(r) >= 6 and r[0] and r[2].startswith("?")
@@ -125,8 +114,8 @@ class FundamentusREITExtractor(Scrapper):
         m3 = {}
         for r in metrics_rows:
             name = self._format_key(r[2])
-            val12 = self._parse_value(r[3])
-            val3 = self._parse_value(r[5])
+            val12 = self._parse_field(name, r[3])
+            val3 = self._parse_field(name, r[5])
             m12[name] = val12
             m3[name] = val3
         indicators_by_period = {"last_12_months": m12, "last_3_months": m3}
@@ -135,10 +124,10 @@ class FundamentusREITExtractor(Scrapper):
         this_row = rows[bs_idx]
         part1 = this_row[this_row.index("Balanço Patrimonial") + 1 :]
         flat = [x for x in (part1) if x]
-        bs_data = {
-            self._format_key(flat[i]): self._parse_value(flat[i + 1])
-            for i in range(0, len(flat), 2)
-        }
+        bs_data = {}
+        for i in range(0, len(flat), 2):
+            key = self._format_key(flat[i])
+            bs_data[key] = self._parse_field(key, flat[i + 1])
 
         return {
             "oscillations": oscillations,
@@ -147,18 +136,23 @@ class FundamentusREITExtractor(Scrapper):
             "balance_sheet": bs_data,
         }
 
-    def scrape(self, ticker: str) -> dict:
-        """Extracts all main sections as arrays of row arrays and returns basic_info_dict from the first row."""
+    def fetch(self, ticker: str) -> str:
         logger.info(f"Scraping REIT data for {ticker}")
-        response = requests.get(f"{self.base_url}?papel={ticker}", headers=self.headers)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
+        return super().fetch(ticker)
+
+    async def fetch_async(self, ticker: str) -> str:
+        logger.info(f"Scraping REIT data for {ticker}")
+        return await super().fetch_async(ticker)
+
+    def parse(self, ticker: str, html: str) -> dict:
+        """Extracts all main sections as arrays of row arrays and returns basic_info_dict from the first row."""
+        page = self._page(html)
 
-        if self._is_reit_not_found(soup):
+        if self._is_reit_not_found(page):
             raise Exception(f"REIT with ticker {ticker} not found on Fundamentus")
 
         basic_info = self._table_rows_to_dict(
-            self._extract_table_rows_by_header(soup, "FII")
+            self._extract_table_rows_by_header(page, "FII")
         )
 
         last_financial_keys = [
@@ -174,11 +168,11 @@ class FundamentusREITExtractor(Scrapper):
         }
 
         oscillations_dict = self.oscillations_to_dict(
-            self._extract_table_rows_by_header(soup, "Oscilações")
+            self._extract_table_rows_by_header(page, "Oscilações")
         )
 
         properties_dict = self._table_rows_to_dict(
-            self._extract_table_rows_by_header(soup, "Imóveis")
+            self._extract_table_rows_by_header(page, "Imóveis")
         )
 
         data = {
@@ -191,12 +185,12 @@ class FundamentusREITExtractor(Scrapper):
             "financial_results": oscillations_dict.get("indicators_by_period", {}),
         }
 
-        return REITDetails.create(**data).model_dump()
+        return REITDetails.create(data).model_dump()
 
-    def _is_reit_not_found(self, soup: BeautifulSoup) -> bool:
+    def _is_reit_not_found(self, page: Page) -> bool:
         """Check if the REIT was not found on Fundamentus."""
-        error_message = soup.find("div", {"class": "error"})
-        if error_message and "papel não encontrado" in error_message.text.lower():
+        error_message = page.error_message()
+        if error_message and "papel não encontrado" in error_message.lower():
             return True
         return False
 
@@ -0,0 +1,72 @@
+import logging
+from typing import Any
+
+from quantiq.core.infra.http.client import HttpClient
+from quantiq.modules.scrapper.providers.fundamentus.data import (
+    AssetType,
+    REITScreenerEntry,
+    StockScreenerEntry,
+)
+from quantiq.modules.scrapper.providers.fundamentus.vocabulary import (
+    SCREENER_KEYS,
+    SCREENER_PARSERS,
+    SCREENER_VOCABULARY,
+)
+from quantiq.modules.scrapper.providers.parser import HtmlParser
+from quantiq.modules.scrapper.providers.scrapper import BulkScrapper
+
+SCREENER_URLS = {
+    AssetType.STOCK: "https://www.fundamentus.com.br/resultado.php",
+    AssetType.REIT: "https://www.fundamentus.com.br/fii_resultado.php",
+}
+
+SCREENER_ENTRIES = {
+    AssetType.STOCK: StockScreenerEntry,
+    AssetType.REIT: REITScreenerEntry,
+}
+
+
+class FundamentusScreenerExtractor(BulkScrapper):
+    """Extracts every listed asset of a type from the Fundamentus screener."""
+
+    def __init__(
+        self,
+        type: AssetType,
+        http_client: HttpClient | None = None,
+        html_parser: HtmlParser | None = None,
+    ):
+        super().__init__(type, http_client, html_parser)
+        self.base_url = SCREENER_URLS[type]
+        self.keys = SCREENER_KEYS[type]
+        self.labels = SCREENER_VOCABULARY[type]
+        self.parsers = SCREENER_PARSERS[type]
+        self.entry = SCREENER_ENTRIES[type]
+        self.logger = logging.getLogger(__name__)
+
+    def parse_all(self, html: str) -> dict[str, dict[str, Any]]:
+        soup = self.html_parser.parse(html)
+        table = soup.find("table", {"id": "resultado"})
+        if table is None:
+            raise Exception(f"Screener table not found on {self.base_url}")
+
+        header = [
+            self._screener_key(th.get_text(strip=True))
+            for th in table.find("thead").find_all("th")  # type: ignore
+        ]
+        entries = {}
+        for tr in table.find("tbody").find_all("tr"):  # type: ignore
+            cells = [td.get_text(strip=True) for td in tr.find_all("td")]  # type: ignore
+            row = {
+                key: self._parse_field(key, value)
+                for key, value in zip(header, cells, strict=False)
+            }
+            row["papel"] = cells[0]
+            try:
+                entries[cells[0]] = self.entry.create(row).model_dump()
+            except Exception as e:
+                self.logger.warning(f"Skipping screener row {cells[0]}: {e!s}")
+        return entries
+
+    def _screener_key(self, label: str) -> str:
+        key = self._format_key(label)
+        return self.keys.get(key, key)
@@ -0,0 +1,177 @@
+from quantiq.modules.scrapper.providers.fundamentus.data import (
+    AssetType,
+    REITDetails,
+    REITScreenerEntry,
+    StockDetails,
+    StockScreenerEntry,
+)
+from quantiq.modules.scrapper.providers.values import schema_parsers
+from quantiq.modules.scrapper.providers.vocabulary import compile_vocabulary
+
+# Labels rendered on ``detalhes.php`` for stocks, banks and REITs.
+DETAIL_LABELS = [
+    # Header
+    "Papel",
+    "Cotação",
+    "Tipo",
+    "Data últ cot",
+    "Empresa",
+    "Min 52 sem",
+    "Setor",
+    "Max 52 sem",
+    "Subsetor",
+    "Vol $ méd (2m)",
+    "Mandato",
+    "Segmento",
+    "Gestão",
+    "Valor de mercado",
+    "Últ balanço processado",
+    "Valor da firma",
+    "Nro. Ações",
+    "Nro. Cotas",
+    "Relatório",
+    "Últ Info Trimestral",
+    # Oscillations
+    "Dia",
+    "Mês",
+    "30 dias",
+    "12 meses",
+    # Indicators
+    "P/L",
+    "LPA",
+    "P/VP",
+    "VPA",
+    "P/EBIT",
+    "PSR",
+    "P/Ativos",
+    "P/Cap. Giro",
+    "P/Ativ Circ Liq",
+    "Marg. Bruta",
+    "Marg. EBIT",
+    "Marg. Líquida",
+    "EBIT / Ativo",
+    "ROIC",
+    "ROE",
+    "Div. Yield",
+    "EV / EBITDA",
+    "EV / EBIT",
+    "Liquidez Corr",
+    "Div Br/ Patrim",
+    "Cres. Rec (5a)",
+    "Giro Ativos",
+    "FFO Yield",
+    "FFO/Cota",
+    "Dividendo/cota",
+    "VP/Cota",
+    # Balance sheet
+    "Ativo",
+    "Ativos",
+    "Dív. Bruta",
+    "Disponibilidades",
+    "Dív. Líquida",
+    "Ativo Circulante",
+    "Patrim. Líq",
+    "Patrim Líquido",
+    "Depósitos",
+    "Cart. de Crédito",
+    # Financial results
+    "Receita",
+    "Receita Líquida",
+    "EBIT",
+    "Lucro Líquido",
+    "Venda de ativos",
+    "FFO",
+    "Rend. Distribuído",
+    "Result Int Financ",
+    "Rec Serviços",
+    # Properties
+    "Qtd imóveis",
+    "Qtd Unidades",
+    "Área (m2)",
+    "Cap Rate",
+    "Vacância Média",
+    "Aluguel/m2",
+    "Preço do m2",
+    "Imóveis/PL do FII",
+]
+
+# The stock page abbreviates a couple of balance sheet labels.
+STOCK_KEYS = {
+    "ativo": "ativos",
+    "patrim_liq": "patrim_liquido",
+}
+
+# Screener column labels that differ from the ones used on ``detalhes.php``.
+SCREENER_KEYS = {
+    AssetType.STOCK: {
+        "p_ativo": "p_ativos",
+        "mrg_ebit": "marg_ebit",
+        "mrg_liq": "marg_liquida",
+        "liq_corr": "liquidez_corr",
+        "div_brut_patrim": "div_br_patrim",
+        "cresc_rec_5a": "cres_rec_5a",
+        "patrim_liq": "patrim_liquido",
+        "liq_2meses": "vol_med_2m",
+    },
+    AssetType.REIT: {
+        "dividend_yield": "div_yield",
+        "qtd_de_imoveis": "qtd_imoveis",
+        "aluguel_por_m2": "aluguel_m2",
+        "liquidez": "vol_med_2m",
+    },
+}
+
+SCREENER_LABELS = {
+    AssetType.STOCK: [
+        "Papel",
+        "Cotação",
+        "P/L",
+        "P/VP",
+        "PSR",
+        "Div.Yield",
+        "P/Ativo",
+        "P/Cap.Giro",
+        "P/EBIT",
+        "P/Ativ Circ.Liq",
+        "EV/EBIT",
+        "EV/EBITDA",
+        "Mrg Ebit",
+        "Mrg. Líq.",
+        "Liq. Corr.",
+        "ROIC",
+        "ROE",
+        "Liq.2meses",
+        "Patrim. Líq",
+        "Dív.Brut/ Patrim.",
+        "Cresc. Rec.5a",
+    ],
+    AssetType.REIT: [
+        "Papel",
+        "Segmento",
+        "Cotação",
+        "FFO Yield",
+        "Dividend Yield",
+        "P/VP",
+        "Valor de Mercado",
+        "Liquidez",
+        "Qtd de imóveis",
+        "Preço do m2",
+        "Aluguel por m2",
+        "Cap Rate",
+        "Vacância Média",
+    ],
+}
+
+STOCK_VOCABULARY = compile_vocabulary(DETAIL_LABELS, STOCK_KEYS)
+REIT_VOCABULARY = compile_vocabulary(DETAIL_LABELS)
+SCREENER_VOCABULARY = {
+    type: compile_vocabulary(labels, SCREENER_KEYS[type])
+    for type, labels in SCREENER_LABELS.items()
+}
+
+STOCK_PARSERS = schema_parsers(StockDetails)
+REIT_PARSERS = schema_parsers(REITDetails)
+SCREENER_PARSERS = {
+    AssetType.STOCK: schema_parsers(StockScreenerEntry),
+    AssetType.REIT: schema_parsers(REITScreenerEntry),
+}
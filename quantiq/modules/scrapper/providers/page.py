@@ -0,0 +1,74 @@
+from typing import NamedTuple
+
+from bs4 import BeautifulSoup
+
+from quantiq.modules.scrapper.providers.parser import HtmlParser, get_html_parser
+
+
+class PageTable(NamedTuple):
+    header: str
+    rows: list[list[str]]
+
+
+class Page:
+    """
+    A parsed page whose tables are walked once.
+
+    Every ``<table>`` is reduced to its rows of stripped cell texts and indexed
+    by the text of each cell of its first row, so section lookups don't rescan
+    the document. Headers that only match as a substring (e.g. "FII" in
+    "FII - CSHG LOGISTICA") fall back to the first table whose header row
+    contains the text, and the answer is memoized.
+    """
+
+    def __init__(self, soup: BeautifulSoup) -> None:
+        self.soup = soup
+        self.tables: list[PageTable] = []
+        self._index: dict[str, int] = {}
+
+        for table in soup.find_all("table"):
+            header = table.find("tr")  # type: ignore
+            if not header:
+                self.tables.append(PageTable("", []))
+                continue
+
+            rows = []
+            for tr in table.find_all("tr"):  # type: ignore
+                cells = [
+                    cell.get_text(strip=True)
+                    for cell in tr.find_all(["th", "td"])  # type: ignore
+                ]
+                if cells:
+                    rows.append(cells)
+
+            position = len(self.tables)
+            self.tables.append(PageTable(header.get_text(), rows))  # type: ignore
+            for cell in rows[0] if rows else []:
+                for key in (cell, cell.lstrip("?")):
+                    self._index.setdefault(key, position)
+
+    @classmethod
+    def from_html(cls, html: str, parser: HtmlParser | None = None) -> "Page":
+        return cls((parser or get_html_parser()).parse(html))
+
+    def rows(self, header_text: str) -> list[list[str]]:
+        position = self._index.get(header_text)
+        if position is None:
+            position = next(
+                (
+                    i
+                    for i, table in enumerate(self.tables)
+                    if header_text in table.header
+                ),
+                -1,
+            )
+            self._index[header_text] = position
+
+        return self.tables[position].rows if position >= 0 else []
+
+    def table(self, position: int) -> list[list[str]]:
+        return self.tables[position].rows if position < len(self.tables) else []
+
+    def error_message(self) -> str | None:
+        error = self.soup.find("div", {"class": "error"})
+        return error.text if error else None
@@ -0,0 +1,94 @@
+import asyncio
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import lru_cache
+import logging
+import multiprocessing
+import threading
+from typing import TYPE_CHECKING, Any
+
+from quantiq.core.config import ScrapperSettings, get_settings
+
+if TYPE_CHECKING:
+    from quantiq.modules.scrapper.providers.scrapper import Scrapper
+
+
+def parse_page(scrapper: "Scrapper", ticker: str, html: str) -> dict[str, Any]:
+    """Entry point run inside the pool: raw HTML in, validated payload out."""
+    return scrapper.parse(ticker, html)
+
+
+def _warm_up() -> None:
+    # Importing the extractors compiles the label vocabularies and the
+    # pydantic validators once per worker instead of on its first page.
+    import quantiq.modules.scrapper.providers.fundamentus.extractor  # noqa: F401
+
+
+class ParsePool:
+    """
+    Warm process pool that turns raw pages into payloads off the event loop.
+
+    BeautifulSoup and pydantic validation are CPU bound and hold the GIL, so a
+    slow page stalls every other request served by the same worker. With a
+    pool, only the fetch happens in the request's process: the scrapper (minus
+    its HTTP client) and the HTML are shipped to a worker, which returns the
+    validated dict. Workers are started with ``spawn`` so they never inherit
+    the server's threads or open sockets.
+    """
+
+    def __init__(self, settings: ScrapperSettings | None = None) -> None:
+        self.logger = logging.getLogger(__name__)
+        self.settings = settings or get_settings().scrapper
+        self._lock = threading.Lock()
+        self._executor: ProcessPoolExecutor | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.settings.parse_workers > 0
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.settings.parse_workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                        initializer=_warm_up,
+                    )
+        return self._executor
+
+    def warm_up(self) -> None:
+        """Start every worker now so the first requests don't pay for it."""
+        futures = [
+            self.executor.submit(_warm_up) for _ in range(self.settings.parse_workers)
+        ]
+        for future in futures:
+            future.result()
+        self.logger.info(f"Parse pool ready with {len(futures)} workers")
+
+    def parse(self, scrapper: "Scrapper", ticker: str, html: str) -> dict[str, Any]:
+        return self.submit(scrapper, ticker, html).result()
+
+    def submit(
+        self, scrapper: "Scrapper", ticker: str, html: str
+    ) -> Future[dict[str, Any]]:
+        return self.executor.submit(parse_page, scrapper, ticker, html)
+
+    async def parse_async(
+        self, scrapper: "Scrapper", ticker: str, html: str
+    ) -> dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, parse_page, scrapper, ticker, html
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
+
+
+@lru_cache(maxsize=1)
+def get_parse_pool() -> ParsePool:
+    return ParsePool()
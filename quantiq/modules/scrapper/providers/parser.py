@@ -0,0 +1,58 @@
+from functools import lru_cache
+import logging
+
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
+
+from quantiq.core.config import ScrapperSettings, get_settings
+
+FALLBACK_PARSER = "html.parser"
+
+
+class HtmlParser:
+    """
+    Builds the soup handed to the scrapper page model.
+
+    The tree builder is chosen per deployment through ``ScrapperSettings``:
+    ``lxml`` is several times faster than the pure-Python ``html.parser`` and
+    is used when installed, falling back to ``html.parser`` otherwise. With
+    ``parse_only_tables`` the builder keeps only ``<table>`` elements, which is
+    all the extractors read. Pages without tables (Fundamentus' "papel não
+    encontrado" page) are re-parsed for their ``div.error`` so not-found
+    detection keeps working.
+    """
+
+    def __init__(self, settings: ScrapperSettings | None = None) -> None:
+        self.logger = logging.getLogger(__name__)
+        self.settings = settings or get_settings().scrapper
+        self.features = self._resolve_features(self.settings.html_parser)
+        self.strainer = (
+            SoupStrainer("table") if self.settings.parse_only_tables else None
+        )
+
+    def parse(self, html: str) -> BeautifulSoup:
+        if self.strainer is None:
+            return BeautifulSoup(html, self.features)
+
+        soup = BeautifulSoup(html, self.features, parse_only=self.strainer)
+        if soup.find("table") is None:
+            return BeautifulSoup(
+                html,
+                self.features,
+                parse_only=SoupStrainer("div", attrs={"class": "error"}),
+            )
+        return soup
+
+    def _resolve_features(self, features: str) -> str:
+        try:
+            BeautifulSoup("", features)
+        except FeatureNotFound:
+            self.logger.warning(
+                f"HTML parser {features!r} is not available, using {FALLBACK_PARSER!r}"
+            )
+            return FALLBACK_PARSER
+        return features
+
+
+@lru_cache(maxsize=1)
+def get_html_parser() -> HtmlParser:
+    return HtmlParser()
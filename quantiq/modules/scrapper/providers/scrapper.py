@@ -1,104 +1,195 @@
 from abc import ABC, abstractmethod
-from datetime import datetime
-import re
-from typing import Any
-import unicodedata
+import asyncio
+from collections.abc import Mapping
+import logging
+import sqlite3
+from typing import Any, NamedTuple
+
+from quantiq.core.infra.archive.page_archive import PageArchive
+from quantiq.core.infra.http.client import HttpClient, get_http_client
+from quantiq.core.utils.fingerprint import content_hash
+from quantiq.modules.scrapper.providers.fundamentus.data import AssetType
+from quantiq.modules.scrapper.providers.page import Page
+from quantiq.modules.scrapper.providers.parse_pool import ParsePool
+from quantiq.modules.scrapper.providers.parser import HtmlParser, get_html_parser
+from quantiq.modules.scrapper.providers.values import ValueParser, parse_value
+from quantiq.modules.scrapper.providers.vocabulary import label_to_key, to_snake_case
 
-from bs4 import BeautifulSoup
 
-from quantiq.modules.scrapper.providers.fundamentus.data import AssetType
+class ScrapeResult(NamedTuple):
+    page_hash: str
+    # ``None`` when the page is unchanged and was not parsed
+    data: dict[str, Any] | None
 
 
 class Scrapper(ABC):
     type: AssetType
-
-    def __init__(self, type: AssetType) -> None:
+    base_url: str
+    # Raw cell label -> payload key for the labels a provider is known to render
+    labels: Mapping[str, str] = {}
+    # Payload key -> typed parser, for the fields a provider's models declare
+    parsers: Mapping[str, ValueParser] = {}
+
+    def __init__(
+        self,
+        type: AssetType,
+        http_client: HttpClient | None = None,
+        html_parser: HtmlParser | None = None,
+    ) -> None:
         self.type = type
+        self.http_client = http_client or get_http_client()
+        self.html_parser = html_parser or get_html_parser()
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Scrappers are shipped to parse pool workers, which never fetch.
+        state = self.__dict__.copy()
+        state.pop("http_client", None)
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.http_client = get_http_client()
+
+    def scrape(
+        self,
+        ticker: str,
+        parse_pool: ParsePool | None = None,
+        archive: PageArchive | None = None,
+    ) -> dict[str, Any]:
+        return self.scrape_if_changed(ticker, None, parse_pool, archive).data  # type: ignore
+
+    async def scrape_async(
+        self,
+        ticker: str,
+        parse_pool: ParsePool | None = None,
+        archive: PageArchive | None = None,
+    ) -> dict[str, Any]:
+        result = await self.scrape_if_changed_async(ticker, None, parse_pool, archive)
+        return result.data  # type: ignore
+
+    def scrape_if_changed(
+        self,
+        ticker: str,
+        page_hash: str | None,
+        parse_pool: ParsePool | None = None,
+        archive: PageArchive | None = None,
+    ) -> ScrapeResult:
+        """Fetch ``ticker`` and parse it unless the page hashes to ``page_hash``."""
+        html = self.fetch(ticker)
+        if archive is not None:
+            self._archive(archive, ticker, html)
+
+        digest = content_hash(html)
+        if digest == page_hash:
+            return ScrapeResult(digest, None)
+        if parse_pool is not None:
+            return ScrapeResult(digest, parse_pool.parse(self, ticker, html))
+        return ScrapeResult(digest, self.parse(ticker, html))
+
+    async def scrape_if_changed_async(
+        self,
+        ticker: str,
+        page_hash: str | None,
+        parse_pool: ParsePool | None = None,
+        archive: PageArchive | None = None,
+    ) -> ScrapeResult:
+        html = await self.fetch_async(ticker)
+        if archive is not None:
+            await asyncio.to_thread(self._archive, archive, ticker, html)
+
+        digest = content_hash(html)
+        if digest == page_hash:
+            return ScrapeResult(digest, None)
+        if parse_pool is not None:
+            data = await parse_pool.parse_async(self, ticker, html)
+            return ScrapeResult(digest, data)
+        return ScrapeResult(digest, self.parse(ticker, html))
+
+    def fetch(self, ticker: str) -> str:
+        response = self.http_client.get(self.base_url, params=self._params(ticker))
+        response.raise_for_status()
+        return response.text
+
+    async def fetch_async(self, ticker: str) -> str:
+        response = await self.http_client.get_async(
+            self.base_url, params=self._params(ticker)
+        )
+        response.raise_for_status()
+        return response.text
 
     @abstractmethod
-    def scrape(self, ticker: str) -> dict[str, Any]:
+    def parse(self, ticker: str, html: str) -> dict[str, Any]:
         pass
 
-    def _to_snake_case(self, s: str) -> str:
-        if not s:
-            return s
+    def _archive(self, archive: PageArchive, ticker: str, html: str) -> None:
+        # Archiving is best effort: a full disk must not fail the request.
+        try:
+            archive.put(self.type.value, ticker, html)
+        except (OSError, sqlite3.Error) as e:
+            logging.getLogger(__name__).warning(f"Could not archive {ticker}: {e!s}")
 
-        s = unicodedata.normalize("NFD", s.lower())
-        s = "".join(c for c in s if unicodedata.category(c) != "Mn")
+    def _page(self, html: str) -> Page:
+        return Page.from_html(html, self.html_parser)
 
-        s = re.sub(r"[^a-z0-9]+", "_", s).strip("_")
-        return s
+    def _params(self, ticker: str) -> dict[str, Any]:
+        return {"papel": ticker}
+
+    def _to_snake_case(self, s: str) -> str:
+        return to_snake_case(s)
 
     def _parse_value(self, value: str) -> float | int | str | None:
-        if value is None or value == "-" or value == "":
-            return None
-
-        v = str(value).strip().replace(".", "").replace(" ", "")
-
-        date_match = re.match(r"^(\d{2})/(\d{2})/(\d{4})$", v)
-
-        if date_match:
-            try:
-                dt = datetime.strptime(v, "%d/%m/%Y")
-                return dt.strftime("%Y-%m-%dT00:00:00Z")
-            except Exception:
-                pass
-
-        if v.endswith("%"):
-            try:
-                return float(v[:-1].replace(",", "."))
-            except Exception:
-                return value
-
-        if "," in v:
-            try:
-                return float(v.replace(",", "."))
-            except Exception:
-                return value
-
-        if v.isdigit():
-            try:
-                return int(v)
-            except Exception:
-                return value
+        return parse_value(value)
 
-        try:
-            return float(v)
-        except Exception:
-            return value
+    def _parse_field(self, key: str, value: str) -> Any:
+        parser = self.parsers.get(key)
+        return parser(value) if parser is not None else parse_value(value)
 
     def _table_rows_to_dict(self, rows: list[list[str]]) -> dict:
         d = {}
         for r in rows:
             for i in range(0, len(r) - 1, 2):
                 k = self._format_key(r[i])
-                v = self._parse_value(r[i + 1])
+                v = self._parse_field(k, r[i + 1])
                 if k and v is not None:
                     d[k] = v
         return d
 
     def _format_key(self, k: str) -> str:
-        if not k:
-            return k
-
-        return self._to_snake_case(k.replace("?", "").strip())
+        key = self.labels.get(k)
+        return key if key is not None else label_to_key(k)
 
     def _clean_keys(self, d: dict) -> dict:
         return {self._format_key(k): v for k, v in d.items() if k}
 
     def _extract_table_rows_by_header(
-        self, soup: BeautifulSoup, header_text: str
+        self, page: Page, header_text: str
     ) -> list[list[str]]:
-        for table in soup.find_all("table"):
-            header = table.find("tr")  # type: ignore
-            if header and header_text in header.get_text():  # type: ignore
-                rows = []
-                for tr in table.find_all("tr"):  # type: ignore
-                    cells = [
-                        cell.get_text(strip=True)
-                        for cell in tr.find_all(["th", "td"])  # type: ignore
-                    ]
-                    if cells:
-                        rows.append(cells)
-                return rows
-        return []
+        return page.rows(header_text)
+
+
+class BulkScrapper(Scrapper):
+    """
+    Scrapper for providers that publish every asset of a type on one page.
+
+    ``scrape_all`` fetches that page once and returns a payload per ticker;
+    ``scrape`` is kept so a bulk provider can still answer single lookups.
+    """
+
+    def scrape_all(self) -> dict[str, dict[str, Any]]:
+        return self.parse_all(self.fetch(""))
+
+    async def scrape_all_async(self) -> dict[str, dict[str, Any]]:
+        return self.parse_all(await self.fetch_async(""))
+
+    def parse(self, ticker: str, html: str) -> dict[str, Any]:
+        entries = self.parse_all(html)
+        if ticker not in entries:
+            raise Exception(f"Ticker {ticker} not found on {self.base_url}")
+        return entries[ticker]
+
+    @abstractmethod
+    def parse_all(self, html: str) -> dict[str, dict[str, Any]]:
+        pass
+
+    def _params(self, ticker: str) -> dict[str, Any]:  # noqa: ARG002
+        return {}
@@ -0,0 +1,150 @@
+from collections.abc import Callable
+from datetime import UTC, datetime
+import re
+from types import NoneType, UnionType
+from typing import Any, Union, get_args, get_origin
+
+from pydantic import AliasChoices, BaseModel
+
+ValueParser = Callable[[str], Any]
+
+DATE = re.compile(r"^(\d{2})/(\d{2})/(\d{4})$")
+EMPTY = frozenset({"", "-"})
+
+
+def parse_value(value: str) -> float | int | str | None:
+    """Infer the type of a cell whose field is unknown (the original try-chain)."""
+    if value is None or value == "-" or value == "":
+        return None
+
+    v = str(value).strip().replace(".", "").replace(" ", "")
+
+    date_match = DATE.match(v)
+
+    if date_match:
+        try:
+            dt = datetime.strptime(v, "%d/%m/%Y")
+            return dt.strftime("%Y-%m-%dT00:00:00Z")
+        except Exception:
+            pass
+
+    if v.endswith("%"):
+        try:
+            return float(v[:-1].replace(",", "."))
+        except Exception:
+            return value
+
+    if "," in v:
+        try:
+            return float(v.replace(",", "."))
+        except Exception:
+            return value
+
+    if v.isdigit():
+        try:
+            return int(v)
+        except Exception:
+            return value
+
+    try:
+        return float(v)
+    except Exception:
+        return value
+
+
+def parse_text(value: str) -> str | None:
+    return None if value in EMPTY else value
+
+
+def parse_integer(value: str) -> int | float | str | None:
+    """BRL amounts and counts: ``1.254.367.000`` -> ``1254367000``."""
+    if value in EMPTY:
+        return None
+
+    v = value.replace(".", "").replace(" ", "")
+    if v.isdigit() or (v[:1] == "-" and v[1:].isdigit()):
+        return int(v)
+    return parse_value(value)
+
+
+def parse_decimal(value: str) -> float | str | None:
+    """Ratios and percentages: ``-35,10`` / ``8,45%`` -> ``-35.1`` / ``8.45``."""
+    if value in EMPTY:
+        return None
+
+    v = value.replace(".", "").replace(" ", "").removesuffix("%").replace(",", ".")
+    try:
+        return float(v)
+    except ValueError:
+        return parse_value(value)  # type: ignore
+
+
+def parse_date(value: str) -> datetime | str | None:
+    """``17/10/2025`` -> ``datetime(2025, 10, 17, tzinfo=UTC)``."""
+    if value in EMPTY:
+        return None
+
+    match = DATE.match(value.strip())
+    if match:
+        day, month, year = match.groups()
+        try:
+            return datetime(int(year), int(month), int(day), tzinfo=UTC)
+        except ValueError:
+            pass
+    return parse_value(value)  # type: ignore
+
+
+TYPE_PARSERS: dict[type, ValueParser] = {
+    str: parse_text,
+    int: parse_integer,
+    float: parse_decimal,
+    datetime: parse_date,
+}
+
+
+def schema_parsers(*models: type[BaseModel]) -> dict[str, ValueParser]:
+    """
+    Map every alias declared by ``models`` (and the models nested in them) to
+    the parser of the field's type, so cells are converted straight to the
+    native value the model expects.
+    """
+    parsers: dict[str, ValueParser] = {}
+    pending = list(models)
+    seen: set[type[BaseModel]] = set()
+
+    while pending:
+        model = pending.pop(0)
+        if model in seen:
+            continue
+        seen.add(model)
+
+        for name, field in model.model_fields.items():
+            annotation = _unwrap_optional(field.annotation)
+            if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+                pending.append(annotation)
+                continue
+
+            parser = TYPE_PARSERS.get(annotation)  # type: ignore
+            if parser is None:
+                continue
+
+            for alias in _aliases(name, field.alias, field.validation_alias):
+                parsers.setdefault(alias, parser)
+
+    return parsers
+
+
+def _unwrap_optional(annotation: Any) -> Any:
+    if get_origin(annotation) in (Union, UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not NoneType]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+def _aliases(name: str, alias: str | None, validation_alias: Any) -> list[str]:
+    if isinstance(validation_alias, AliasChoices):
+        return [
+            choice for choice in validation_alias.choices if isinstance(choice, str)
+        ]
+    return [alias or name]
@@ -0,0 +1,47 @@
+from collections.abc import Iterable, Mapping
+from functools import lru_cache
+import re
+import unicodedata
+
+NON_ALPHANUMERIC = re.compile(r"[^a-z0-9]+")
+
+
+@lru_cache(maxsize=4096)
+def to_snake_case(s: str) -> str:
+    if not s:
+        return s
+
+    s = unicodedata.normalize("NFD", s.lower())
+    s = "".join(c for c in s if unicodedata.category(c) != "Mn")
+
+    return NON_ALPHANUMERIC.sub("_", s).strip("_")
+
+
+@lru_cache(maxsize=4096)
+def label_to_key(label: str) -> str:
+    """Slow path for labels outside a compiled vocabulary, memoized per label."""
+    if not label:
+        return label
+
+    return to_snake_case(label.replace("?", "").strip())
+
+
+def compile_vocabulary(
+    labels: Iterable[str], overrides: Mapping[str, str] | None = None
+) -> dict[str, str]:
+    """
+    Map raw cell labels straight to payload keys.
+
+    Each label is registered as rendered by the provider, with and without the
+    ``?`` help marker Fundamentus prefixes to its labels, so a cell's text is a
+    single dict lookup away from its key. ``overrides`` renames the computed
+    keys, for pages whose labels differ from the vocabulary the models use.
+    """
+    overrides = overrides or {}
+    vocabulary = {}
+    for label in labels:
+        key = label_to_key(label)
+        key = overrides.get(key, key)
+        vocabulary[label] = key
+        vocabulary[f"?{label}"] = key
+    return vocabulary
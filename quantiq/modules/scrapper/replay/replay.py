@@ -0,0 +1,187 @@
+"""
+Re-run the extractors over the page archive, without any HTTP request.
+
+    python -m quantiq.modules.scrapper.replay.replay --type stocks --workers 4
+
+Parses the newest archived page of every ticker (``--all`` for every
+archived fetch) in a process pool and stores the payloads, so a parser fix or
+a new field can be backfilled for the cost of CPU alone.
+"""
+
+import argparse
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import Future
+from itertools import islice
+import json
+import logging
+from typing import Any
+
+from pydantic import BaseModel
+
+from quantiq.core.config import ScrapperSettings
+from quantiq.core.infra.archive.page_archive import (
+    ArchivedPage,
+    PageArchive,
+    get_page_archive,
+)
+from quantiq.core.infra.databases.sqlite.sqlite import Sqlite
+from quantiq.modules.assets.repositories.asset_details_repository import (
+    AssetDetailsRepository,
+)
+from quantiq.modules.assets.repositories.asset_fingerprint_repository import (
+    AssetFingerprintRepository,
+)
+from quantiq.modules.assets.repositories.asset_repository import AssetRepository
+from quantiq.modules.assets.services.asset_details_service import AssetDetailsService
+from quantiq.modules.assets.services.asset_service import AssetService
+from quantiq.modules.scrapper.providers.fundamentus.data import AssetType
+from quantiq.modules.scrapper.providers.fundamentus.extractor import (
+    FundamentusREITExtractor,
+    FundamentusStockExtractor,
+)
+from quantiq.modules.scrapper.providers.parse_pool import ParsePool, parse_page
+from quantiq.modules.scrapper.providers.scrapper import Scrapper
+
+logger = logging.getLogger(__name__)
+
+
+class ReplayResult(BaseModel):
+    page: ArchivedPage
+    data: dict[str, Any] | None = None
+    error: str | None = None
+
+
+class ReplayReport(BaseModel):
+    pages: int = 0
+    parsed: int = 0
+    failed: int = 0
+    persisted: int = 0
+
+
+def replay_pages(
+    archive: PageArchive,
+    pages: Iterable[ArchivedPage],
+    scrappers: Mapping[str, Scrapper],
+    parse_pool: ParsePool | None = None,
+    chunk_size: int = 64,
+) -> Iterator[ReplayResult]:
+    """Parse archived ``pages`` in order, ``chunk_size`` at a time."""
+    pending = iter(pages)
+    while chunk := list(islice(pending, chunk_size)):
+        jobs = [(page, _submit(archive, page, scrappers, parse_pool)) for page in chunk]
+        for page, job in jobs:
+            try:
+                yield ReplayResult(page=page, data=job.result())
+            except Exception as e:
+                yield ReplayResult(page=page, error=str(e))
+
+
+def _submit(
+    archive: PageArchive,
+    page: ArchivedPage,
+    scrappers: Mapping[str, Scrapper],
+    parse_pool: ParsePool | None,
+) -> Future[dict[str, Any]]:
+    future: Future[dict[str, Any]] = Future()
+    try:
+        scrapper = scrappers[page.type]
+        html = archive.read(page)
+        if parse_pool is not None and parse_pool.enabled:
+            return parse_pool.submit(scrapper, page.ticker, html)
+        future.set_result(parse_page(scrapper, page.ticker, html))
+    except Exception as e:
+        future.set_exception(e)
+    return future
+
+
+def replay(
+    archive: PageArchive,
+    asset_service: AssetService | None,
+    type: str | None = None,
+    tickers: list[str] | None = None,
+    latest: bool = True,
+    workers: int = 0,
+    batch_size: int = 256,
+) -> ReplayReport:
+    """Replay the archive and persist the payloads unless ``asset_service`` is None."""
+    scrappers: dict[str, Scrapper] = {
+        AssetType.STOCK.value: FundamentusStockExtractor(),
+        AssetType.REIT.value: FundamentusREITExtractor(),
+    }
+    parse_pool = ParsePool(ScrapperSettings(parse_workers=workers))
+    report = ReplayReport()
+    batch: list[dict[str, Any]] = []
+
+    def flush() -> None:
+        nonlocal batch
+        if asset_service is not None and batch:
+            results = asset_service.insert_assets(batch)
+            report.persisted += sum(
+                not isinstance(result, Exception) for result in results.values()
+            )
+        batch = []
+
+    try:
+        pages = archive.pages(type, tickers, latest)
+        for result in replay_pages(archive, pages, scrappers, parse_pool):
+            report.pages += 1
+            if result.data is None:
+                report.failed += 1
+                logger.warning(
+                    f"Could not replay {result.page.ticker} fetched at "
+                    f"{result.page.fetched_at}: {result.error}"
+                )
+                continue
+            report.parsed += 1
+            batch.append(result.data)
+            if len(batch) >= batch_size:
+                flush()
+        flush()
+    finally:
+        parse_pool.close()
+    return report
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--type", choices=[type.value for type in AssetType])
+    parser.add_argument("--ticker", action="append", dest="tickers")
+    parser.add_argument(
+        "--all", action="store_true", help="replay every archived fetch"
+    )
+    parser.add_argument("--workers", type=int, default=0)
+    parser.add_argument("--db", default="quantiq.db")
+    parser.add_argument(
+        "--dry-run", action="store_true", help="parse without storing anything"
+    )
+    args = parser.parse_args(argv)
+
+    archive = get_page_archive()
+    if archive is None:
+        parser.error("QUANTIQ_SCRAPPER_ARCHIVE_DIR is not set")
+
+    asset_service = None
+    if not args.dry_run:
+        Sqlite.create_database(args.db)
+        database = Sqlite(args.db)
+        asset_service = AssetService(
+            AssetRepository(database),
+            AssetDetailsService(AssetDetailsRepository(database)),
+            AssetFingerprintRepository(database),
+        )
+
+    report = replay(
+        archive,  # type: ignore
+        asset_service,
+        args.type,
+        args.tickers,
+        latest=not args.all,
+        workers=args.workers,
+    )
+    print(json.dumps(report.model_dump()))
+    return 0 if report.failed == 0 else 1
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    raise SystemExit(main())
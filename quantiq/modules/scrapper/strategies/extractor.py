@@ -1,18 +1,134 @@
-from typing import Any
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
 
+from quantiq.core.infra.archive.page_archive import PageArchive
+from quantiq.core.infra.cache.ttl_cache import TTLCache
+from quantiq.core.infra.resilience.circuit_breaker import CircuitBreaker
 from quantiq.modules.scrapper.providers.fundamentus.data import AssetType
-from quantiq.modules.scrapper.providers.scrapper import Scrapper
+from quantiq.modules.scrapper.providers.parse_pool import ParsePool
+from quantiq.modules.scrapper.providers.scrapper import (
+    BulkScrapper,
+    ScrapeResult,
+    Scrapper,
+)
+
+T = TypeVar("T")
 
 
 class ExtractorStrategy:
     strategy: set[tuple[AssetType, Scrapper]] = set()
+    bulk_strategy: set[tuple[AssetType, BulkScrapper]] = set()
+    parse_pool: ParsePool | None = None
+    cache: TTLCache | None = None
+    circuit_breaker: CircuitBreaker | None = None
+    archive: PageArchive | None = None
 
     def set_strategy(self, strategy: Scrapper) -> None:
         self.strategy.add((strategy.type, strategy))
 
-    def execute(self, type: AssetType, ticker: str) -> dict[str, Any]:
+    def set_bulk_strategy(self, strategy: BulkScrapper) -> None:
+        self.bulk_strategy.add((strategy.type, strategy))
+
+    def set_parse_pool(self, parse_pool: ParsePool | None) -> None:
+        """Parse fetched pages in ``parse_pool``'s processes (``None`` disables)."""
+        self.parse_pool = parse_pool
+
+    def set_cache(self, cache: TTLCache | None) -> None:
+        """Reuse extracted payloads, keyed by (type, ticker), while ``cache`` holds them."""
+        self.cache = cache
+
+    def set_circuit_breaker(self, circuit_breaker: CircuitBreaker | None) -> None:
+        """Fail fast with ``CircuitOpenError`` while the provider keeps failing."""
+        self.circuit_breaker = circuit_breaker
+
+    def set_archive(self, archive: PageArchive | None) -> None:
+        """Keep every fetched detail page in ``archive`` for offline replays."""
+        self.archive = archive
+
+    def get_strategy(self, type: AssetType) -> Scrapper:
         for scrapper_type, scrapper in self.strategy:
             if scrapper_type == type:
-                return scrapper.scrape(ticker)
+                return scrapper
 
         raise ValueError(f"Invalid type: {type}")
+
+    def get_bulk_strategy(self, type: AssetType) -> BulkScrapper:
+        for scrapper_type, scrapper in self.bulk_strategy:
+            if scrapper_type == type:
+                return scrapper
+
+        raise ValueError(f"Invalid bulk type: {type}")
+
+    def execute(self, type: AssetType, ticker: str) -> dict[str, Any]:
+        return self.execute_if_changed(type, ticker, None).data  # type: ignore
+
+    async def execute_async(self, type: AssetType, ticker: str) -> dict[str, Any]:
+        result = await self.execute_if_changed_async(type, ticker, None)
+        return result.data  # type: ignore
+
+    def execute_if_changed(
+        self, type: AssetType, ticker: str, page_hash: str | None
+    ) -> ScrapeResult:
+        """Scrape ``ticker``, skipping the parse if its page still hashes to ``page_hash``."""
+        key = self.cache_key(type, ticker)
+        result = self._cached(key)
+        if result is None:
+            scrapper = self.get_strategy(type)
+            result = self._guarded(
+                lambda: scrapper.scrape_if_changed(
+                    ticker, page_hash, self.parse_pool, self.archive
+                )
+            )
+            self._store(key, result)
+        return self._unless_unchanged(result, page_hash)
+
+    async def execute_if_changed_async(
+        self, type: AssetType, ticker: str, page_hash: str | None
+    ) -> ScrapeResult:
+        key = self.cache_key(type, ticker)
+        result = self._cached(key)
+        if result is None:
+            scrapper = self.get_strategy(type)
+            result = await self._guarded_async(
+                lambda: scrapper.scrape_if_changed_async(
+                    ticker, page_hash, self.parse_pool, self.archive
+                )
+            )
+            self._store(key, result)
+        return self._unless_unchanged(result, page_hash)
+
+    def execute_all(self, type: AssetType) -> dict[str, dict[str, Any]]:
+        scrapper = self.get_bulk_strategy(type)
+        return self._guarded(scrapper.scrape_all)
+
+    async def execute_all_async(self, type: AssetType) -> dict[str, dict[str, Any]]:
+        scrapper = self.get_bulk_strategy(type)
+        return await self._guarded_async(scrapper.scrape_all_async)
+
+    @staticmethod
+    def cache_key(type: AssetType, ticker: str) -> tuple[AssetType, str]:
+        return (type, ticker.upper())
+
+    def _guarded(self, fn: Callable[[], T]) -> T:
+        if self.circuit_breaker is None or not self.circuit_breaker.enabled:
+            return fn()
+        return self.circuit_breaker.call(fn)
+
+    async def _guarded_async(self, fn: Callable[[], Awaitable[T]]) -> T:
+        if self.circuit_breaker is None or not self.circuit_breaker.enabled:
+            return await fn()
+        return await self.circuit_breaker.call_async(fn)
+
+    @staticmethod
+    def _unless_unchanged(result: ScrapeResult, page_hash: str | None) -> ScrapeResult:
+        if result.page_hash == page_hash:
+            return ScrapeResult(result.page_hash, None)
+        return result
+
+    def _cached(self, key: tuple[AssetType, str]) -> ScrapeResult | None:
+        return self.cache.get(key) if self.cache is not None else None
+
+    def _store(self, key: tuple[AssetType, str], result: ScrapeResult) -> None:
+        # Unparsed (unchanged) results carry nothing worth reusing
+        if self.cache is not None and result.data is not None:
+            self.cache.set(key, result)
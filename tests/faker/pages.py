@@ -0,0 +1,13 @@
+import json
+from pathlib import Path
+from typing import Any
+
+FIXTURES = Path(__file__).resolve().parent.parent / "fixtures" / "fundamentus"
+
+
+def load_page(name: str) -> str:
+    return (FIXTURES / name).read_text(encoding="utf-8")
+
+
+def load_expected(name: str) -> Any:
+    return json.loads((FIXTURES / "expected" / f"{name}.json").read_text("utf-8"))
@@ -0,0 +1,61 @@
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from pytest import fixture
+
+from quantiq.core.infra.archive.page_archive import PageArchive
+from tests.faker.pages import load_page
+
+
+class TestPageArchive:
+    @fixture
+    def archive(self, tmp_path: Path) -> PageArchive:
+        return PageArchive(tmp_path / "archive")
+
+    @fixture
+    def html(self) -> str:
+        return load_page("detalhes_petr4.html")
+
+    def test_put_and_read(self, archive: PageArchive, html: str):
+        page = archive.put("stocks", "petr4", html)
+
+        assert page.ticker == "PETR4"
+        assert page.codec == "zlib"
+        assert page.size == len(html.encode("utf-8"))
+        assert page.stored_size < page.size / 3
+        assert archive.read(page) == html
+
+    def test_identical_pages_are_stored_once(self, archive: PageArchive, html: str):
+        first = archive.put("stocks", "PETR4", html)
+        second = archive.put("stocks", "PETR4", html)
+        archive.put("stocks", "PETR4", html + "<!-- changed -->")
+
+        assert first.digest == second.digest
+        assert first.id != second.id
+        assert len(list(archive.objects.rglob("*.zz"))) == 2
+
+        stats = archive.stats()
+        assert (stats.pages, stats.objects) == (3, 2)
+        assert stats.stored_size < stats.size
+
+    def test_pages_are_indexed_by_ticker_and_fetch_time(self, archive: PageArchive):
+        now = datetime.now(UTC)
+        archive.put("stocks", "PETR4", "<html>old</html>", now - timedelta(days=1))
+        archive.put("stocks", "PETR4", "<html>new</html>", now)
+        archive.put("reits", "HGLG11", "<html>reit</html>", now)
+
+        latest = list(archive.pages())
+        assert [(page.ticker, archive.read(page)) for page in latest] == [
+            ("PETR4", "<html>new</html>"),
+            ("HGLG11", "<html>reit</html>"),
+        ]
+        assert [page.fetched_at for page in archive.pages(tickers=["petr4"])] == [now]
+        assert len(list(archive.pages(type="stocks", latest=False))) == 2
+        assert [page.ticker for page in archive.pages(type="reits")] == ["HGLG11"]
+
+    def test_unavailable_codec_falls_back_to_zlib(self, tmp_path: Path, html: str):
+        archive = PageArchive(tmp_path, codec="brotli")
+
+        page = archive.put("stocks", "PETR4", html)
+        assert page.codec == "zlib"
+        assert archive.read(page) == html
@@ -0,0 +1,98 @@
+import pickle
+
+from pytest import fixture
+
+from quantiq.core.infra.cache.ttl_cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTTLCache:
+    @fixture
+    def clock(self) -> FakeClock:
+        return FakeClock()
+
+    @fixture
+    def cache(self, clock: FakeClock) -> TTLCache:
+        return TTLCache(ttl_seconds=60, max_entries=2, max_bytes=1024, clock=clock)
+
+    def test_hit_returns_a_copy(self, cache: TTLCache):
+        cache.set("PETR4", {"price": 38.52})
+
+        first = cache.get("PETR4")
+        assert first == {"price": 38.52}
+        first["price"] = 0  # type: ignore
+        assert cache.get("PETR4") == {"price": 38.52}
+        assert cache.stats().hits == 2
+
+    def test_miss(self, cache: TTLCache):
+        assert cache.get("PETR4") is None
+        assert cache.stats().misses == 1
+
+    def test_expired_entries_are_dropped(self, cache: TTLCache, clock: FakeClock):
+        cache.set("PETR4", {"price": 38.52})
+        clock.now += 60
+
+        assert cache.get("PETR4") is None
+        stats = cache.stats()
+        assert (stats.entries, stats.bytes, stats.expirations) == (0, 0, 1)
+
+    def test_evicts_least_recently_used_over_entry_limit(self, cache: TTLCache):
+        cache.set("PETR4", 1)
+        cache.set("VALE3", 2)
+        cache.get("PETR4")
+        cache.set("ITUB4", 3)
+
+        assert cache.get("VALE3") is None
+        assert cache.get("PETR4") == 1
+        assert cache.stats().evictions == 1
+
+    def test_evicts_over_byte_limit(self, clock: FakeClock):
+        value = "x" * 100
+        size = len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        cache = TTLCache(60, max_entries=10, max_bytes=size * 2, clock=clock)
+        for key in ("A", "B", "C"):
+            cache.set(key, value)
+
+        assert [entry.key for entry in cache.entries()] == ["B", "C"]
+        assert cache.stats().bytes == size * 2
+
+    def test_skips_values_larger_than_the_cache(self, cache: TTLCache):
+        cache.set("PETR4", "x" * 2048)
+        assert cache.get("PETR4") is None
+
+    def test_disabled_with_zero_ttl(self, clock: FakeClock):
+        cache = TTLCache(0, max_entries=10, max_bytes=1024, clock=clock)
+        cache.set("PETR4", 1)
+
+        assert not cache.enabled
+        assert cache.get("PETR4") is None
+
+    def test_invalidate(self, cache: TTLCache):
+        cache.set("PETR4", 1)
+        cache.set("VALE3", 2)
+
+        assert cache.invalidate("PETR4")
+        assert not cache.invalidate("PETR4")
+        assert cache.invalidate_where(lambda key: key == "VALE3") == 1
+        assert cache.stats().entries == 0
+
+    def test_clear(self, cache: TTLCache):
+        cache.set("PETR4", 1)
+        assert cache.clear() == 1
+        assert cache.stats().bytes == 0
+
+    def test_entries(self, cache: TTLCache, clock: FakeClock):
+        cache.set("PETR4", 1)
+        clock.now += 10
+
+        (entry,) = cache.entries(lambda key: f"stocks:{key}")
+        assert entry.key == "stocks:PETR4"
+        assert entry.age_seconds == 10
+        assert entry.expires_in_seconds == 50
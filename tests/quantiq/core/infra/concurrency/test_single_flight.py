@@ -0,0 +1,96 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+
+from pytest import mark, raises
+
+from quantiq.core.infra.concurrency.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    def test_do_coalesces_concurrent_threads(self):
+        flights = SingleFlight()
+        release = threading.Event()
+        calls = 0
+
+        def work() -> int:
+            nonlocal calls
+            calls += 1
+            release.wait(timeout=5)
+            return 42
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(flights.do, "PETR4", work)]
+            while flights.in_flight() == 0:
+                time.sleep(0.001)
+            futures += [executor.submit(flights.do, "PETR4", work) for _ in range(7)]
+            time.sleep(0.05)
+            release.set()
+            results = [future.result(timeout=5) for future in futures]
+
+        assert results == [42] * 8
+        assert calls == 1
+        assert flights.in_flight() == 0
+
+    def test_do_shares_exceptions_and_forgets_finished_calls(self):
+        flights = SingleFlight()
+
+        def fail() -> None:
+            raise ValueError("boom")
+
+        with raises(ValueError, match="boom"):
+            flights.do("PETR4", fail)
+        assert flights.do("PETR4", lambda: 1) == 1
+
+    @mark.asyncio
+    async def test_do_async_coalesces_concurrent_coroutines(self):
+        flights = SingleFlight()
+        calls = 0
+
+        async def work() -> int:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return calls
+
+        results = await asyncio.gather(
+            *(flights.do_async("PETR4", work) for _ in range(30)),
+            flights.do_async("VALE3", work),
+        )
+
+        assert results[:30] == [results[0]] * 30
+        assert calls == 2
+        assert flights.in_flight() == 0
+
+    @mark.asyncio
+    async def test_do_async_survives_a_cancelled_waiter(self):
+        flights = SingleFlight()
+
+        async def work() -> str:
+            await asyncio.sleep(0.01)
+            return "done"
+
+        first = asyncio.ensure_future(flights.do_async("PETR4", work))
+        second = asyncio.ensure_future(flights.do_async("PETR4", work))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == "done"
+        with raises(asyncio.CancelledError):
+            await first
+
+    @mark.asyncio
+    async def test_do_async_shares_exceptions(self):
+        flights = SingleFlight()
+
+        async def fail() -> None:
+            await asyncio.sleep(0)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            flights.do_async("PETR4", fail),
+            flights.do_async("PETR4", fail),
+            return_exceptions=True,
+        )
+        assert all(isinstance(result, ValueError) for result in results)
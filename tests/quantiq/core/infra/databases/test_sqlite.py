@@ -0,0 +1,56 @@
+from pathlib import Path
+
+from pytest import fixture, raises
+
+from quantiq.core.infra.databases.sqlite.sqlite import Sqlite
+
+
+class TestSqlite:
+    @fixture
+    def db(self, tmp_path: Path) -> Sqlite:
+        db_name = str(tmp_path / "quantiq.db")
+        Sqlite.create_database(db_name)
+        return Sqlite(db_name)
+
+    def insert(self, db: Sqlite, ticker: str) -> int:
+        return db.upsert(
+            "INSERT INTO assets (ticker, name, type) VALUES (?, ?, ?)",
+            (ticker, ticker, "stocks"),
+        )
+
+    def count(self, db: Sqlite) -> int:
+        row = db.fetch_one("SELECT COUNT(*) FROM assets")
+        assert row is not None
+        return row[0]
+
+    def test_upsert_commits_and_returns_rowid(self, db: Sqlite):
+        assert self.insert(db, "PETR4") == 1
+        assert db.fetch_all("SELECT ticker FROM assets") == [("PETR4",)]
+
+    def test_transaction_commits_all_statements_together(self, db: Sqlite):
+        with db.transaction():
+            self.insert(db, "PETR4")
+            self.insert(db, "VALE3")
+            assert self.count(db) == 2
+
+        assert self.count(db) == 2
+
+    def test_transaction_rolls_back_on_error(self, db: Sqlite):
+        with raises(RuntimeError), db.transaction():
+            self.insert(db, "PETR4")
+            raise RuntimeError("boom")
+
+        assert self.count(db) == 0
+
+    def test_nested_transaction_only_rolls_back_its_savepoint(self, db: Sqlite):
+        with db.transaction():
+            self.insert(db, "PETR4")
+            with raises(RuntimeError), db.transaction():
+                self.insert(db, "VALE3")
+                raise RuntimeError("boom")
+            self.insert(db, "ITUB4")
+
+        assert db.fetch_all("SELECT ticker FROM assets ORDER BY ticker") == [
+            ("ITUB4",),
+            ("PETR4",),
+        ]
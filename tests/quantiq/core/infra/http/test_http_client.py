@@ -0,0 +1,167 @@
+import asyncio
+import threading
+import time
+from unittest.mock import Mock, patch
+
+from pytest import fixture, mark, raises
+import requests
+from requests.adapters import HTTPAdapter
+
+from quantiq.core.config import HttpSettings
+from quantiq.core.infra.http.client import HttpClient, get_http_client
+
+
+class TestHttpClient:
+    @fixture
+    def settings(self) -> HttpSettings:
+        return HttpSettings(
+            pool_connections=2,
+            pool_maxsize=8,
+            connect_timeout=1.5,
+            read_timeout=3.0,
+            user_agent="quantiq-test",
+            rate_limit_enabled=False,
+            retry_backoff_base=0.01,
+        )
+
+    @fixture
+    def client(self, settings: HttpSettings) -> HttpClient:
+        return HttpClient(settings)
+
+    def test_session_is_pooled_and_reused(self, client: HttpClient):
+        session = client.session
+        adapter = session.get_adapter("https://www.fundamentus.com.br")
+
+        assert client.session is session
+        assert isinstance(adapter, HTTPAdapter)
+        assert adapter._pool_connections == 2
+        assert adapter._pool_maxsize == 8
+        assert adapter._pool_block is True
+
+    def test_session_negotiates_gzip_and_keep_alive(self, client: HttpClient):
+        headers = client.session.headers
+        assert headers["User-Agent"] == "quantiq-test"
+        assert "gzip" in headers["Accept-Encoding"]
+        assert headers["Connection"] == "keep-alive"
+
+    def test_get_uses_connect_and_read_timeouts(self, client: HttpClient):
+        with patch.object(client.session, "get") as mock_get:
+            mock_get.return_value = Mock(status_code=200)
+            response = client.get("https://example.com", params={"papel": "PETR4"})
+
+            assert response.status_code == 200
+            mock_get.assert_called_once_with(
+                "https://example.com",
+                params={"papel": "PETR4"},
+                headers=None,
+                timeout=(1.5, 3.0),
+            )
+
+    def test_close_discards_session(self, client: HttpClient):
+        session = client.session
+        client.close()
+        assert client.session is not session
+
+    def test_get_http_client_is_shared(self):
+        assert get_http_client() is get_http_client()
+
+    @mark.asyncio
+    async def test_get_async_bounds_concurrency_per_host(self, settings: HttpSettings):
+        settings.max_concurrency_per_host = 2
+        client = HttpClient(settings)
+        in_flight = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def fake_get(*args, **kwargs):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+            return Mock(status_code=200)
+
+        with patch.object(client, "_send", side_effect=fake_get):
+            responses = await asyncio.gather(
+                *(client.get_async("https://example.com/a") for _ in range(10))
+            )
+
+        assert len(responses) == 10
+        assert peak <= 2
+        client.close()
+
+    def test_get_retries_throttled_responses_honoring_retry_after(
+        self, client: HttpClient
+    ):
+        throttled = Mock(status_code=429, headers={"Retry-After": "2"})
+        ok = Mock(status_code=200)
+
+        with (
+            patch.object(client.session, "get", side_effect=[throttled, ok]),
+            patch("quantiq.core.infra.http.client.time.sleep") as mock_sleep,
+        ):
+            assert client.get("https://example.com") is ok
+
+        mock_sleep.assert_called_once_with(2.0)
+
+    def test_get_returns_last_response_when_out_of_retries(
+        self, client: HttpClient, settings: HttpSettings
+    ):
+        settings.retry_max_attempts = 2
+        unavailable = Mock(status_code=503, headers={})
+
+        with (
+            patch.object(client.session, "get", return_value=unavailable) as mock_get,
+            patch("quantiq.core.infra.http.client.time.sleep"),
+        ):
+            assert client.get("https://example.com") is unavailable
+
+        assert mock_get.call_count == 3
+
+    def test_get_retries_connection_errors_then_raises(
+        self, client: HttpClient, settings: HttpSettings
+    ):
+        settings.retry_max_attempts = 1
+        error = requests.ConnectionError("reset by peer")
+
+        with (
+            patch.object(client.session, "get", side_effect=error) as mock_get,
+            patch("quantiq.core.infra.http.client.time.sleep"),
+            raises(requests.ConnectionError),
+        ):
+            client.get("https://example.com")
+
+        assert mock_get.call_count == 2
+
+    def test_get_feeds_the_host_rate_limiter(self, settings: HttpSettings):
+        settings.rate_limit_enabled = True
+        client = HttpClient(settings)
+        bucket = client.rate_limiter.bucket("example.com")
+        initial = bucket.rate
+
+        with patch.object(client.session, "get", return_value=Mock(status_code=200)):
+            client.get("https://example.com/a")
+        assert bucket.rate > initial
+
+        throttled = Mock(status_code=429, headers={})
+        with (
+            patch.object(
+                client.session, "get", side_effect=[throttled, Mock(status_code=200)]
+            ),
+            patch("quantiq.core.infra.http.client.time.sleep"),
+        ):
+            client.get("https://example.com/a")
+        assert bucket.rate < initial
+
+    @mark.asyncio
+    async def test_get_async_retries_server_errors(self, client: HttpClient):
+        responses = [Mock(status_code=502, headers={}), Mock(status_code=200)]
+
+        with patch.object(client, "_send", side_effect=responses) as mock_send:
+            response = await client.get_async("https://example.com")
+
+        assert response.status_code == 200
+        assert mock_send.call_count == 2
+        client.close()
@@ -0,0 +1,89 @@
+from pytest import approx, fixture
+
+from quantiq.core.config import HttpSettings
+from quantiq.core.infra.http.rate_limiter import AdaptiveTokenBucket, HostRateLimiter
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestAdaptiveTokenBucket:
+    @fixture
+    def clock(self) -> FakeClock:
+        return FakeClock()
+
+    @fixture
+    def settings(self) -> HttpSettings:
+        return HttpSettings(
+            rate_limit_initial=2.0,
+            rate_limit_min=0.5,
+            rate_limit_max=4.0,
+            rate_limit_burst=2,
+            rate_limit_increase=1.0,
+            rate_limit_decrease_factor=0.5,
+            rate_limit_decrease_cooldown=1.0,
+            rate_limit_target_latency=1.0,
+        )
+
+    @fixture
+    def bucket(self, settings: HttpSettings, clock: FakeClock) -> AdaptiveTokenBucket:
+        return AdaptiveTokenBucket(settings, clock)
+
+    def test_reserve_spaces_requests_after_the_burst(
+        self, bucket: AdaptiveTokenBucket, clock: FakeClock
+    ):
+        assert [bucket.reserve() for _ in range(4)] == [0.0, 0.0, 0.5, 1.0]
+
+        clock.now += 1.0
+        assert bucket.reserve() == approx(0.5)
+
+    def test_tokens_refill_up_to_the_burst(
+        self, bucket: AdaptiveTokenBucket, clock: FakeClock
+    ):
+        bucket.reserve()
+        bucket.reserve()
+        clock.now += 60
+
+        assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.5]
+
+    def test_success_increases_rate_additively_up_to_max(
+        self, bucket: AdaptiveTokenBucket
+    ):
+        bucket.on_success(latency=0.1)
+        assert bucket.rate == approx(2.5)
+
+        for _ in range(100):
+            bucket.on_success(latency=0.1)
+        assert bucket.rate == 4.0
+
+    def test_congestion_decreases_rate_once_per_cooldown(
+        self, bucket: AdaptiveTokenBucket, clock: FakeClock
+    ):
+        bucket.on_congestion()
+        bucket.on_congestion()
+        assert bucket.rate == 1.0
+
+        clock.now += 1.0
+        bucket.on_congestion()
+        clock.now += 1.0
+        bucket.on_congestion()
+        assert bucket.rate == 0.5
+
+    def test_slow_responses_count_as_congestion(self, bucket: AdaptiveTokenBucket):
+        bucket.on_success(latency=5.0)
+        assert bucket.rate == 1.0
+
+
+class TestHostRateLimiter:
+    def test_keeps_one_bucket_per_host(self):
+        limiter = HostRateLimiter(HttpSettings(rate_limit_initial=3.0))
+
+        bucket = limiter.bucket("www.fundamentus.com.br")
+        assert limiter.bucket("www.fundamentus.com.br") is bucket
+        assert limiter.bucket("example.com") is not bucket
+        assert limiter.rates() == {"www.fundamentus.com.br": 3.0, "example.com": 3.0}
@@ -0,0 +1,69 @@
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+import random
+from unittest.mock import Mock
+
+from pytest import approx, fixture
+import requests
+
+from quantiq.core.config import HttpSettings
+from quantiq.core.infra.http.retry import RetryPolicy, is_upstream_failure
+
+
+class TestRetryPolicy:
+    @fixture
+    def policy(self) -> RetryPolicy:
+        settings = HttpSettings(
+            retry_max_attempts=2, retry_backoff_base=0.5, retry_backoff_max=4.0
+        )
+        return RetryPolicy(settings, random.Random(7))
+
+    def test_can_retry(self, policy: RetryPolicy):
+        assert policy.can_retry(0)
+        assert policy.can_retry(1)
+        assert not policy.can_retry(2)
+
+    def test_is_retryable(self, policy: RetryPolicy):
+        assert policy.is_retryable(Mock(status_code=429))
+        assert policy.is_retryable(Mock(status_code=503))
+        assert not policy.is_retryable(Mock(status_code=404))
+
+    def test_delay_uses_full_jitter_exponential_backoff(self, policy: RetryPolicy):
+        for attempt, ceiling in [(0, 0.5), (1, 1.0), (2, 2.0), (5, 4.0)]:
+            delays = [policy.delay(attempt) for _ in range(50)]
+            assert all(0 <= delay <= ceiling for delay in delays)
+            assert len(set(delays)) > 1
+
+    def test_delay_honors_retry_after_seconds(self, policy: RetryPolicy):
+        assert policy.delay(0, Mock(headers={"Retry-After": "3"})) == 3.0
+        assert policy.delay(0, Mock(headers={"Retry-After": "120"})) == 4.0
+
+    def test_retry_after_accepts_http_dates(self, policy: RetryPolicy):
+        when = datetime.now(UTC) + timedelta(seconds=30)
+        response = Mock(headers={"Retry-After": format_datetime(when, usegmt=True)})
+
+        assert policy.retry_after(response) == approx(30, abs=2)
+        assert policy.retry_after(Mock(headers={"Retry-After": "soon"})) is None
+        assert policy.retry_after(Mock(headers={})) is None
+
+
+class TestIsUpstreamFailure:
+    def http_error(self, status_code: int) -> requests.HTTPError:
+        return requests.HTTPError(response=Mock(status_code=status_code))
+
+    def test_transport_errors_and_unhealthy_statuses(self):
+        assert is_upstream_failure(requests.ConnectionError())
+        assert is_upstream_failure(requests.ReadTimeout())
+        assert is_upstream_failure(self.http_error(503))
+        assert is_upstream_failure(self.http_error(429))
+        assert not is_upstream_failure(self.http_error(404))
+        assert not is_upstream_failure(Exception("Company not found"))
+
+    def test_follows_the_exception_chain(self):
+        try:
+            try:
+                raise requests.ConnectTimeout()
+            except requests.ConnectTimeout as e:
+                raise Exception("Failed to scrape data for PETR4") from e
+        except Exception as e:
+            assert is_upstream_failure(e)
@@ -0,0 +1,137 @@
+import asyncio
+
+from pytest import fixture, mark, raises
+
+from quantiq.core.infra.resilience.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 50.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class UpstreamDown(Exception):
+    pass
+
+
+def fail() -> None:
+    raise UpstreamDown("connection refused")
+
+
+class TestCircuitBreaker:
+    @fixture
+    def clock(self) -> FakeClock:
+        return FakeClock()
+
+    @fixture
+    def breaker(self, clock: FakeClock) -> CircuitBreaker:
+        return CircuitBreaker(
+            "Fundamentus",
+            failure_threshold=2,
+            reset_timeout=10,
+            is_failure=lambda e: isinstance(e, UpstreamDown),
+            clock=clock,
+        )
+
+    def trip(self, breaker: CircuitBreaker) -> None:
+        for _ in range(breaker.failure_threshold):
+            with raises(UpstreamDown):
+                breaker.call(fail)
+
+    def test_opens_after_consecutive_failures(self, breaker: CircuitBreaker):
+        with raises(UpstreamDown):
+            breaker.call(fail)
+        assert breaker.call(lambda: "ok") == "ok"
+        assert breaker.stats().failures == 0
+
+        self.trip(breaker)
+        assert breaker.state == CircuitState.OPEN
+
+    def test_fails_fast_while_open(self, breaker: CircuitBreaker, clock: FakeClock):
+        self.trip(breaker)
+        clock.now += 4
+        calls = []
+
+        with raises(CircuitOpenError) as e:
+            breaker.call(lambda: calls.append(1))
+
+        assert calls == []
+        assert e.value.status_code == 503
+        assert e.value.headers == {"Retry-After": "6"}
+        assert breaker.stats().retry_in_seconds == 6
+
+    def test_half_open_probe_closes_on_success(
+        self, breaker: CircuitBreaker, clock: FakeClock
+    ):
+        self.trip(breaker)
+        clock.now += 10
+        assert breaker.state == CircuitState.HALF_OPEN
+
+        assert breaker.call(lambda: "recovered") == "recovered"
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_half_open_probe_reopens_on_failure(
+        self, breaker: CircuitBreaker, clock: FakeClock
+    ):
+        self.trip(breaker)
+        clock.now += 10
+
+        with raises(UpstreamDown):
+            breaker.call(fail)
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.stats().retry_in_seconds == 10
+
+    def test_half_open_admits_limited_probes(
+        self, breaker: CircuitBreaker, clock: FakeClock
+    ):
+        self.trip(breaker)
+        clock.now += 10
+
+        breaker.before_call()
+        with raises(CircuitOpenError):
+            breaker.before_call()
+
+    def test_ignores_errors_that_are_not_failures(self, breaker: CircuitBreaker):
+        def not_found() -> None:
+            raise ValueError("ticker not found")
+
+        for _ in range(5):
+            with raises(ValueError):
+                breaker.call(not_found)
+        assert breaker.state == CircuitState.CLOSED
+
+    @mark.asyncio
+    async def test_call_async(self, breaker: CircuitBreaker, clock: FakeClock):
+        async def fail_async() -> None:
+            raise UpstreamDown("timeout")
+
+        for _ in range(2):
+            with raises(UpstreamDown):
+                await breaker.call_async(fail_async)
+        with raises(CircuitOpenError):
+            await breaker.call_async(fail_async)
+
+        clock.now += 10
+
+        async def probe() -> None:
+            await asyncio.sleep(1)
+
+        task = asyncio.ensure_future(breaker.call_async(probe))
+        await asyncio.sleep(0)
+        task.cancel()
+        with raises(asyncio.CancelledError):
+            await task
+
+        # The cancelled probe gave its slot back
+        async def ok() -> str:
+            return "ok"
+
+        assert await breaker.call_async(ok) == "ok"
+        assert breaker.state == CircuitState.CLOSED
@@ -0,0 +1,39 @@
+from pytest import fixture
+
+from quantiq.core.infra.cache.ttl_cache import TTLCache
+from quantiq.modules.admin.manager.admin_manager import AdminManager
+from quantiq.modules.scrapper.providers.fundamentus.data import AssetType
+
+
+class TestAdminManager:
+    @fixture
+    def cache(self) -> TTLCache:
+        cache = TTLCache(ttl_seconds=60, max_entries=10, max_bytes=1024)
+        cache.set((AssetType.STOCK, "PETR4"), {"ticker": "PETR4"})
+        cache.set((AssetType.STOCK, "VALE3"), {"ticker": "VALE3"})
+        cache.set((AssetType.REIT, "HGLG11"), {"ticker": "HGLG11"})
+        return cache
+
+    @fixture
+    def manager(self, cache: TTLCache) -> AdminManager:
+        return AdminManager(cache)
+
+    def test_get_cache(self, manager: AdminManager):
+        response = manager.get_cache()
+
+        assert response.stats.entries == 3
+        assert [entry.key for entry in response.entries] == [
+            "stocks:PETR4",
+            "stocks:VALE3",
+            "reits:HGLG11",
+        ]
+
+    def test_invalidate_by_ticker(self, manager: AdminManager, cache: TTLCache):
+        assert manager.invalidate_cache(ticker="petr4").invalidated == 1
+        assert cache.get((AssetType.STOCK, "PETR4")) is None
+
+    def test_invalidate_by_type(self, manager: AdminManager):
+        assert manager.invalidate_cache(type=AssetType.STOCK).invalidated == 2
+
+    def test_invalidate_all(self, manager: AdminManager):
+        assert manager.invalidate_cache().invalidated == 3
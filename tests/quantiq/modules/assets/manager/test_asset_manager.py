@@ -0,0 +1,236 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
+import threading
+import time
+from typing import Any
+from unittest.mock import AsyncMock, Mock
+
+from faker import Faker
+from pytest import fixture, mark, raises
+import requests
+
+from quantiq.core.config import AssetSettings
+from quantiq.core.infra.resilience.circuit_breaker import CircuitOpenError
+from quantiq.modules.assets.domains.assets import Asset, AssetDetails
+from quantiq.modules.assets.errors import AssetBatchTooLargeError
+from quantiq.modules.assets.manager.asset_manager import AssetManager
+from quantiq.modules.assets.services.asset_service import AssetService
+from quantiq.modules.scrapper.providers.fundamentus.data import AssetType
+from quantiq.modules.scrapper.strategies.extractor import ExtractorStrategy
+
+
+class TestAssetManager:
+    @fixture
+    def extractor(self) -> Mock:
+        return Mock(spec=ExtractorStrategy)
+
+    @fixture
+    def asset_service(self) -> Mock:
+        return Mock(spec=AssetService)
+
+    @fixture
+    def manager(self, extractor: Mock, asset_service: Mock) -> AssetManager:
+        settings = AssetSettings(batch_workers=2, batch_max_tickers=3)
+        return AssetManager(extractor, asset_service, settings)
+
+    @mark.asyncio
+    async def test_create_assets_async(
+        self, fake: Faker, manager: AssetManager, extractor: Mock, asset_service: Mock
+    ):
+        stocks = [fake.stock_data(), fake.stock_data()]
+        payloads = {stock["ticker"]: stock for stock in stocks}
+
+        async def execute_async(_: Any, ticker: str) -> dict[str, Any]:
+            if ticker not in payloads:
+                raise Exception(f"Company with ticker {ticker} not found")
+            return payloads[ticker]
+
+        extractor.execute_async = AsyncMock(side_effect=execute_async)
+        asset_service.insert_assets.side_effect = lambda data: {
+            item["ticker"]: Asset.create(item) for item in data
+        }
+
+        tickers = [stocks[0]["ticker"], "XXXX3", stocks[1]["ticker"]]
+        response = await manager.create_assets_async(tickers)
+
+        assert [r.ticker for r in response.results] == [
+            stocks[0]["ticker"],
+            stocks[1]["ticker"],
+        ]
+        assert all(r.status == "success" for r in response.results)
+        assert response.results[0].data is not None
+        assert response.results[0].data.name == stocks[0]["name"]
+        assert len(response.errors) == 1
+        assert response.errors[0].ticker == "XXXX3"
+        assert response.errors[0].status == "error"
+        assert "not found" in str(response.errors[0].error)
+        asset_service.insert_assets.assert_called_once_with(stocks)
+
+    @mark.asyncio
+    async def test_create_assets_async_rejects_large_batches(
+        self, manager: AssetManager
+    ):
+        with raises(AssetBatchTooLargeError):
+            await manager.create_assets_async(["A3", "B3", "C3", "D3"])
+
+    @mark.asyncio
+    async def test_refresh_universe_async(
+        self, manager: AssetManager, extractor: Mock, asset_service: Mock
+    ):
+        entries = {"PETR4": {"ticker": "PETR4"}, "VALE3": {"ticker": "VALE3"}}
+        extractor.execute_all_async = AsyncMock(return_value=entries)
+        asset_service.upsert_universe.return_value = 2
+
+        response = await manager.refresh_universe_async(AssetType.STOCK)
+
+        assert response.type == AssetType.STOCK
+        assert response.count == 2
+        assert response.data == list(entries.values())
+        asset_service.upsert_universe.assert_called_once_with(
+            AssetType.STOCK, ["PETR4", "VALE3"]
+        )
+
+    @fixture
+    def stored(self, fake: Faker) -> Asset:
+        return Asset.create(
+            {
+                **fake.stock_data(),
+                "id": 1,
+                "updated_at": datetime.now(UTC).replace(tzinfo=None),
+                "asset_details": AssetDetails(sector="Petróleo"),
+            }
+        )
+
+    @mark.asyncio
+    async def test_get_asset_async_serves_fresh_rows_without_scraping(
+        self, manager: AssetManager, extractor: Mock, asset_service: Mock, stored: Asset
+    ):
+        asset_service.find_asset.return_value = stored
+
+        assert await manager.get_asset_async(stored.ticker) is stored
+        extractor.execute_async.assert_not_called()
+
+    @mark.asyncio
+    async def test_get_asset_async_scrapes_unknown_tickers(
+        self, fake: Faker, manager: AssetManager, extractor: Mock, asset_service: Mock
+    ):
+        data = fake.stock_data()
+        extractor.execute_async = AsyncMock(return_value=data)
+        asset_service.find_asset.return_value = None
+        asset_service.insert_asset.return_value = Asset.create(data)
+
+        asset = await manager.get_asset_async(data["ticker"])
+
+        assert asset.ticker == data["ticker"]
+        asset_service.insert_asset.assert_called_once_with(data)
+
+    @mark.asyncio
+    async def test_get_asset_async_revalidates_stale_rows_in_background(
+        self, manager: AssetManager, extractor: Mock, asset_service: Mock, stored: Asset
+    ):
+        stored.updated_at = datetime.now(UTC) - timedelta(hours=1)
+        asset_service.find_asset.return_value = stored
+        extractor.execute_async = AsyncMock(return_value={"ticker": stored.ticker})
+        asset_service.insert_asset.return_value = stored
+
+        assert await manager.get_asset_async(stored.ticker) is stored
+        assert await manager.get_asset_async(stored.ticker) is stored
+        await asyncio.gather(*manager._revalidating.values())
+
+        extractor.execute_async.assert_awaited_once_with(AssetType.STOCK, stored.ticker)
+        assert manager._revalidating == {}
+        assert stored.stale
+
+    def test_is_fresh_uses_ttl_of_asset_type(
+        self, manager: AssetManager, stored: Asset
+    ):
+        manager.settings.stock_ttl_seconds = 60
+        manager.settings.reit_ttl_seconds = 0
+        assert manager.is_fresh(stored)
+
+        stored.type = AssetType.REIT
+        assert not manager.is_fresh(stored)
+
+    @mark.asyncio
+    async def test_create_asset_async_coalesces_concurrent_requests(
+        self, fake: Faker, manager: AssetManager, extractor: Mock, asset_service: Mock
+    ):
+        data = fake.stock_data()
+
+        async def execute_async(*_: Any) -> dict[str, Any]:
+            await asyncio.sleep(0.01)
+            return data
+
+        extractor.execute_async = AsyncMock(side_effect=execute_async)
+        asset_service.insert_asset.return_value = Asset.create(data)
+
+        ticker = data["ticker"]
+        assets = await asyncio.gather(
+            *(manager.create_asset_async(ticker) for _ in range(30)),
+            manager.create_asset_async(ticker.lower()),
+        )
+
+        assert all(asset is assets[0] for asset in assets)
+        extractor.execute_async.assert_awaited_once()
+        asset_service.insert_asset.assert_called_once_with(data)
+
+    def test_create_asset_coalesces_concurrent_threads(
+        self, fake: Faker, manager: AssetManager, extractor: Mock, asset_service: Mock
+    ):
+        data = fake.stock_data()
+        release = threading.Event()
+
+        def execute(*_: Any) -> dict[str, Any]:
+            release.wait(timeout=5)
+            return data
+
+        extractor.execute.side_effect = execute
+        asset_service.insert_asset.return_value = Asset.create(data)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(manager.create_asset, data["ticker"])]
+            while not extractor.execute.called:
+                time.sleep(0.001)
+            futures += [
+                executor.submit(manager.create_asset, data["ticker"]) for _ in range(3)
+            ]
+            time.sleep(0.05)
+            release.set()
+            assets = [future.result(timeout=5) for future in futures]
+
+        assert all(asset.ticker == data["ticker"] for asset in assets)
+        extractor.execute.assert_called_once()
+        asset_service.insert_asset.assert_called_once_with(data)
+
+    @mark.asyncio
+    async def test_get_asset_async_serves_stored_asset_while_provider_is_down(
+        self, manager: AssetManager, extractor: Mock, asset_service: Mock, stored: Asset
+    ):
+        stored.asset_details = None
+        asset_service.find_asset.return_value = stored
+        extractor.execute_async = AsyncMock(
+            side_effect=CircuitOpenError("Fundamentus", retry_after=30)
+        )
+
+        asset = await manager.get_asset_async(stored.ticker)
+
+        assert asset is stored
+        assert asset.stale
+
+    @mark.asyncio
+    async def test_get_asset_async_raises_when_nothing_is_stored(
+        self, manager: AssetManager, extractor: Mock, asset_service: Mock
+    ):
+        asset_service.find_asset.return_value = None
+        extractor.execute_async = AsyncMock(
+            side_effect=CircuitOpenError("Fundamentus", retry_after=30)
+        )
+
+        with raises(CircuitOpenError):
+            await manager.get_asset_async("PETR4")
+
+    def test_is_provider_unavailable(self, manager: AssetManager):
+        assert manager.is_provider_unavailable(CircuitOpenError("Fundamentus", 1))
+        assert manager.is_provider_unavailable(requests.ConnectionError())
+        assert not manager.is_provider_unavailable(Exception("Company not found"))
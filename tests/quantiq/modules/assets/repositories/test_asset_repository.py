@@ -7,6 +7,7 @@ from pytest import fixture
 
 from quantiq.modules.assets.domains.assets import Asset
 from quantiq.modules.assets.repositories.asset_repository import AssetRepository
+from quantiq.modules.scrapper.providers.fundamentus.data import AssetType
 
 
 class TestAssetRepository:
@@ -76,3 +77,20 @@ class TestAssetRepository:
         mock_db.upsert.assert_called_once_with(
             query, (asset["ticker"], asset["name"], asset["type"].value)
         )
+
+    def test_upsert_ticker(self, repository: AssetRepository, mock_db: Mock):
+        mock_db.upsert.return_value = 7
+        assert repository.upsert_ticker("PETR4", AssetType.STOCK) == 7
+
+        query = """
+            INSERT INTO assets (ticker, name, type) VALUES (?, ?, ?)
+            ON CONFLICT(ticker) DO UPDATE SET type = excluded.type
+        """
+        mock_db.upsert.assert_called_once_with(query, ("PETR4", "PETR4", "stocks"))
+
+    def test_touch(self, repository: AssetRepository, mock_db: Mock):
+        repository.touch(7)
+
+        mock_db.upsert.assert_called_once_with(
+            "UPDATE assets SET updated_at = CURRENT_TIMESTAMP WHERE id = ?", (7,)
+        )
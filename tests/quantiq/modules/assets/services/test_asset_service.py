@@ -5,7 +5,7 @@ from unittest.mock import Mock, patch
 from faker import Faker
 from pytest import fixture, raises
 
-from quantiq.modules.assets.domains.assets import Asset, AssetType
+from quantiq.modules.assets.domains.assets import Asset, AssetDetails, AssetType
 from quantiq.modules.assets.repositories.asset_repository import AssetRepository
 from quantiq.modules.assets.services.asset_details_service import AssetDetailsService
 from quantiq.modules.assets.services.asset_service import (
@@ -99,3 +99,44 @@ class TestAssetService:
 
                 when_insert_asset()
                 when_insert_asset_already_exists()
+
+    def test_insert_assets(self, fake: Faker, service: AssetService, mock_db: Mock):
+        ok, failing = fake.stock_data(), fake.stock_data()
+
+        def insert_asset(data: dict[str, Any]) -> Asset:
+            if data is failing:
+                raise ValueError("Asset not found")
+            return Asset.create(data)
+
+        with patch.object(AssetService, "insert_asset", side_effect=insert_asset):
+            results = service.insert_assets([ok, failing])
+
+        assert isinstance(results[ok["ticker"]], Asset)
+        assert isinstance(results[failing["ticker"]], ValueError)
+        assert mock_db.transaction.call_count == 3
+
+    def test_upsert_universe(self, service: AssetService, mock_db: Mock):
+        with patch.object(AssetRepository, "upsert_ticker") as mock_upsert_ticker:
+            count = service.upsert_universe(AssetType.REIT, ["HGLG11", "KNRI11"])
+
+        assert count == 2
+        assert mock_upsert_ticker.call_count == 2
+        mock_upsert_ticker.assert_called_with("KNRI11", AssetType.REIT)
+        mock_db.transaction.assert_called_once()
+
+    def test_find_asset(self, asset: dict[str, Any], service: AssetService):
+        with (
+            patch.object(AssetRepository, "get_by_ticker") as mock_get_by_ticker,
+            patch.object(
+                AssetDetailsService, "get_asset_details_by_ticker"
+            ) as mock_get_details,
+        ):
+            mock_get_by_ticker.return_value = Asset.create(asset)
+            mock_get_details.return_value = AssetDetails(sector="Energia")
+
+            found = service.find_asset(asset["ticker"])
+            assert found is not None
+            assert found.asset_details == mock_get_details.return_value
+
+            mock_get_by_ticker.return_value = None
+            assert service.find_asset(asset["ticker"]) is None
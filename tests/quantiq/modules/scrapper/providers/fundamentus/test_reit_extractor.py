@@ -0,0 +1,47 @@
+from unittest.mock import Mock
+
+from pytest import fixture, mark, raises
+
+from quantiq.core.infra.http.client import HttpClient
+from quantiq.modules.scrapper.providers.fundamentus.extractor import (
+    FundamentusREITExtractor,
+)
+from tests.faker.pages import load_page
+
+
+class TestFundamentusREITExtractor:
+    @fixture
+    def http_client(self) -> Mock:
+        return Mock(spec=HttpClient)
+
+    @fixture
+    def extractor(self, http_client: Mock) -> FundamentusREITExtractor:
+        return FundamentusREITExtractor(http_client)
+
+    def test_parse(self, extractor: FundamentusREITExtractor):
+        data = extractor.parse("HGLG11", load_page("detalhes_hglg11.html"))
+
+        assert data["ticker"] == "HGLG11"
+        assert data["segment"] == "Logística"
+        assert data["management"] == "Renda"
+        assert data["asset"]["price"] == 160.45
+        assert data["variations"]["twelve_months"] == 4.35
+        assert data["indicators"]["ffo_yield"] == 8.45
+        assert data["balance_sheet"]["total_assets"] == 5234000000
+        assert data["financial_results"]["last_12_months"]["ffo"] == 298400000
+        assert data["property_metrics"]["property_count"] == 24
+        assert data["property_metrics"]["price_per_sqm"] == 2710.0
+
+    def test_parse_not_found(self, extractor: FundamentusREITExtractor):
+        with raises(Exception, match="not found on Fundamentus"):
+            extractor.parse("XXXX11", load_page("detalhes_not_found.html"))
+
+    @mark.asyncio
+    async def test_scrape_async(
+        self, extractor: FundamentusREITExtractor, http_client: Mock
+    ):
+        http_client.get_async.return_value = Mock(
+            text=load_page("detalhes_hglg11.html")
+        )
+        data = await extractor.scrape_async("HGLG11")
+        assert data["ticker"] == "HGLG11"
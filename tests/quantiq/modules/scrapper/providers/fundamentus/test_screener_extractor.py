@@ -0,0 +1,70 @@
+from unittest.mock import Mock
+
+from pytest import fixture, mark, raises
+
+from quantiq.core.infra.http.client import HttpClient
+from quantiq.modules.scrapper.providers.fundamentus.data import AssetType
+from quantiq.modules.scrapper.providers.fundamentus.extractor import (
+    FundamentusScreenerExtractor,
+)
+from tests.faker.pages import load_page
+
+
+class TestFundamentusScreenerExtractor:
+    @fixture
+    def http_client(self) -> Mock:
+        return Mock(spec=HttpClient)
+
+    def test_parse_all_stocks(self, http_client: Mock):
+        extractor = FundamentusScreenerExtractor(AssetType.STOCK, http_client)
+        entries = extractor.parse_all(load_page("resultado.html"))
+
+        assert list(entries) == ["PETR4", "VALE3", "OIBR3"]
+        petr4 = entries["PETR4"]
+        assert petr4["price"] == 38.52
+        assert petr4["avg_volume_2m"] == 1254367000.0
+        assert petr4["shareholders_equity"] == 410260000000.0
+        assert petr4["indicators"]["pe_ratio"] == 5.1
+        assert petr4["indicators"]["price_to_assets"] == 0.442
+        assert petr4["indicators"]["net_margin"] == 19.2
+        assert petr4["indicators"]["current_ratio"] == 0.92
+        assert petr4["indicators"]["debt_to_equity"] == 0.88
+        assert petr4["indicators"]["revenue_growth_5y"] == 12.4
+        assert entries["OIBR3"]["shareholders_equity"] == -28000000000.0
+
+    def test_parse_all_reits(self, http_client: Mock):
+        extractor = FundamentusScreenerExtractor(AssetType.REIT, http_client)
+        entries = extractor.parse_all(load_page("fii_resultado.html"))
+
+        hglg11 = entries["HGLG11"]
+        assert hglg11["segment"] == "Logística"
+        assert hglg11["market_value"] == 4952100000
+        assert hglg11["indicators"]["dividend_yield"] == 8.9
+        assert hglg11["indicators"]["ffo_yield"] == 8.45
+        assert hglg11["property_metrics"]["property_count"] == 24
+        assert hglg11["property_metrics"]["rent_per_sqm"] == 24.15
+
+    def test_scrape_all_fetches_one_page(self, http_client: Mock):
+        http_client.get.return_value = Mock(text=load_page("resultado.html"))
+        extractor = FundamentusScreenerExtractor(AssetType.STOCK, http_client)
+
+        assert len(extractor.scrape_all()) == 3
+        http_client.get.assert_called_once_with(
+            "https://www.fundamentus.com.br/resultado.php", params={}
+        )
+
+    def test_scrape_single_ticker(self, http_client: Mock):
+        http_client.get.return_value = Mock(text=load_page("resultado.html"))
+        extractor = FundamentusScreenerExtractor(AssetType.STOCK, http_client)
+
+        assert extractor.scrape("VALE3")["price"] == 61.37
+        with raises(Exception, match="XXXX3 not found"):
+            extractor.scrape("XXXX3")
+
+    @mark.asyncio
+    async def test_scrape_all_async(self, http_client: Mock):
+        http_client.get_async.return_value = Mock(text=load_page("fii_resultado.html"))
+        extractor = FundamentusScreenerExtractor(AssetType.REIT, http_client)
+
+        entries = await extractor.scrape_all_async()
+        assert set(entries) == {"HGLG11", "KNRI11", "MXRF11"}
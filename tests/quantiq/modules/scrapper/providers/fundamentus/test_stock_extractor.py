@@ -0,0 +1,72 @@
+from datetime import UTC, datetime
+from unittest.mock import Mock
+
+from pytest import fixture, mark, raises
+import requests
+
+from quantiq.core.infra.http.client import HttpClient
+from quantiq.modules.scrapper.providers.fundamentus.extractor import (
+    FundamentusStockExtractor,
+)
+from tests.faker.pages import load_page
+
+
+class TestFundamentusStockExtractor:
+    @fixture
+    def http_client(self) -> Mock:
+        return Mock(spec=HttpClient)
+
+    @fixture
+    def extractor(self, http_client: Mock) -> FundamentusStockExtractor:
+        return FundamentusStockExtractor(http_client)
+
+    def test_parse(self, extractor: FundamentusStockExtractor):
+        data = extractor.parse("PETR4", load_page("detalhes_petr4.html"))
+
+        assert data["ticker"] == "PETR4"
+        assert data["name"] == "PETROBRAS PN"
+        assert data["governance"] == "PN N2"
+        assert data["market_value"] == 496421000000
+        assert data["number_of_stocks"] == 12888700000
+        assert data["last_balance_proccessed"] == datetime(2025, 6, 30, tzinfo=UTC)
+        assert data["asset"]["price"] == 38.52
+        assert data["asset"]["avg_volume_2m"] == 1254367000
+        assert data["variations"]["day"] == -0.52
+        assert data["variations"]["yearly_variations"][0] == {
+            "year": 2025,
+            "variation": 7.63,
+        }
+        assert data["indicators"]["pe_ratio"] == 5.1
+        assert data["indicators"]["debt_to_equity"] == 0.88
+        assert data["balance_sheet"]["total_assets"] == 1123450000000
+        assert data["balance_sheet"]["shareholders_equity"] == 410260000000
+        assert data["financial_results"]["last_3_months"]["revenue"] == 119567000000
+
+    def test_scrape_not_found(
+        self, extractor: FundamentusStockExtractor, http_client: Mock
+    ):
+        http_client.get.return_value = Mock(text=load_page("detalhes_not_found.html"))
+        with raises(Exception, match="not found on Fundamentus"):
+            extractor.scrape("XXXX3")
+
+    def test_scrape_http_404(
+        self, extractor: FundamentusStockExtractor, http_client: Mock
+    ):
+        response = Mock(status_code=404)
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError(
+            response=response
+        )
+        http_client.get.return_value = response
+        with raises(Exception, match="Company with ticker XXXX3 not found"):
+            extractor.scrape("XXXX3")
+
+    @mark.asyncio
+    async def test_scrape_async(
+        self, extractor: FundamentusStockExtractor, http_client: Mock
+    ):
+        http_client.get_async.return_value = Mock(text=load_page("detalhes_petr4.html"))
+        data = await extractor.scrape_async("PETR4")
+        assert data["ticker"] == "PETR4"
+        http_client.get_async.assert_awaited_once_with(
+            "https://www.fundamentus.com.br/detalhes.php", params={"papel": "PETR4"}
+        )
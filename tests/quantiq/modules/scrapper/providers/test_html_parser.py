@@ -0,0 +1,74 @@
+from unittest.mock import Mock
+
+from pydantic_core import to_jsonable_python
+from pytest import fixture, mark, raises
+
+from quantiq.core.config import ScrapperSettings
+from quantiq.modules.scrapper.providers.fundamentus.data import AssetType
+from quantiq.modules.scrapper.providers.fundamentus.extractor import (
+    FundamentusREITExtractor,
+    FundamentusScreenerExtractor,
+    FundamentusStockExtractor,
+)
+from quantiq.modules.scrapper.providers.parser import HtmlParser
+from tests.faker.pages import load_expected, load_page
+
+BACKENDS = [
+    ("html.parser", False),
+    ("html.parser", True),
+    ("lxml", False),
+    ("lxml", True),
+]
+
+
+class TestHtmlParser:
+    @fixture(params=BACKENDS, ids=lambda p: f"{p[0]}{'-tables' if p[1] else ''}")
+    def html_parser(self, request) -> HtmlParser:
+        html_parser, parse_only_tables = request.param
+        return HtmlParser(
+            ScrapperSettings(
+                html_parser=html_parser, parse_only_tables=parse_only_tables
+            )
+        )
+
+    def test_stock_page_matches_recorded_output(self, html_parser: HtmlParser):
+        extractor = FundamentusStockExtractor(Mock(), html_parser)
+        data = extractor.parse("PETR4", load_page("detalhes_petr4.html"))
+
+        assert to_jsonable_python(data) == load_expected("detalhes_petr4")
+
+    def test_reit_page_matches_recorded_output(self, html_parser: HtmlParser):
+        extractor = FundamentusREITExtractor(Mock(), html_parser)
+        data = extractor.parse("HGLG11", load_page("detalhes_hglg11.html"))
+
+        assert to_jsonable_python(data) == load_expected("detalhes_hglg11")
+
+    @mark.parametrize(
+        "type, page",
+        [(AssetType.STOCK, "resultado"), (AssetType.REIT, "fii_resultado")],
+    )
+    def test_screener_matches_recorded_output(
+        self, html_parser: HtmlParser, type: AssetType, page: str
+    ):
+        extractor = FundamentusScreenerExtractor(type, Mock(), html_parser)
+        data = extractor.parse_all(load_page(f"{page}.html"))
+
+        assert to_jsonable_python(data) == load_expected(page)
+
+    def test_not_found_page_is_detected(self, html_parser: HtmlParser):
+        extractor = FundamentusStockExtractor(Mock(), html_parser)
+
+        with raises(Exception, match="not found on Fundamentus"):
+            extractor.parse("XXXX3", load_page("detalhes_not_found.html"))
+
+    def test_parse_only_tables_drops_the_rest_of_the_page(self):
+        html_parser = HtmlParser(ScrapperSettings(parse_only_tables=True))
+        soup = html_parser.parse(load_page("detalhes_petr4.html"))
+
+        assert soup.find("table") is not None
+        assert soup.find("head") is None
+
+    def test_unavailable_parser_falls_back_to_html_parser(self):
+        html_parser = HtmlParser(ScrapperSettings(html_parser="not-a-parser"))
+
+        assert html_parser.features == "html.parser"
@@ -0,0 +1,41 @@
+from pytest import fixture
+
+from quantiq.modules.scrapper.providers.page import Page
+from tests.faker.pages import load_page
+
+
+class TestPage:
+    @fixture
+    def page(self) -> Page:
+        return Page.from_html(load_page("detalhes_petr4.html"))
+
+    def test_indexes_tables_by_header_cell(self, page: Page):
+        rows = page.rows("Oscilações")
+
+        assert rows[0][0] == "Oscilações"
+        assert rows is page.rows("Oscilações")
+
+    def test_indexes_header_cells_without_help_marker(self, page: Page):
+        assert page.rows("Papel")[0][1] == "PETR4"
+
+    def test_falls_back_to_substring_match(self):
+        page = Page.from_html(load_page("detalhes_hglg11.html"))
+
+        assert page.rows("FII")[0][0].startswith("FII")
+
+    def test_unknown_header_returns_no_rows(self, page: Page):
+        assert page.rows("Não existe") == []
+
+    def test_table_by_position(self, page: Page):
+        assert page.table(0) == page.rows("Papel")
+        assert page.table(99) == []
+
+    def test_error_message(self, page: Page):
+        assert page.error_message() is None
+        assert (
+            "não encontrado"
+            in (
+                Page.from_html(load_page("detalhes_not_found.html")).error_message()
+                or ""
+            ).lower()
+        )
@@ -0,0 +1,69 @@
+import pickle
+from unittest.mock import Mock
+
+from pydantic_core import to_jsonable_python
+from pytest import fixture, mark, raises
+
+from quantiq.core.config import ScrapperSettings
+from quantiq.modules.scrapper.providers.fundamentus.extractor import (
+    FundamentusStockExtractor,
+)
+from quantiq.modules.scrapper.providers.parse_pool import ParsePool
+from tests.faker.pages import load_expected, load_page
+
+
+@fixture(scope="module")
+def parse_pool():
+    parse_pool = ParsePool(ScrapperSettings(parse_workers=1))
+    parse_pool.warm_up()
+    yield parse_pool
+    parse_pool.close()
+
+
+class TestParsePool:
+    @fixture
+    def extractor(self) -> FundamentusStockExtractor:
+        return FundamentusStockExtractor(Mock())
+
+    def test_enabled(self):
+        assert ParsePool(ScrapperSettings(parse_workers=2)).enabled
+        assert not ParsePool(ScrapperSettings(parse_workers=0)).enabled
+
+    def test_scrapper_is_shipped_without_its_http_client(
+        self, extractor: FundamentusStockExtractor
+    ):
+        clone = pickle.loads(pickle.dumps(extractor))
+
+        assert clone.base_url == extractor.base_url
+        assert clone.http_client is not extractor.http_client
+
+    def test_parse(self, parse_pool: ParsePool, extractor: FundamentusStockExtractor):
+        data = parse_pool.parse(extractor, "PETR4", load_page("detalhes_petr4.html"))
+
+        assert to_jsonable_python(data) == load_expected("detalhes_petr4")
+
+    @mark.asyncio
+    async def test_parse_async(
+        self, parse_pool: ParsePool, extractor: FundamentusStockExtractor
+    ):
+        data = await parse_pool.parse_async(
+            extractor, "PETR4", load_page("detalhes_petr4.html")
+        )
+
+        assert data["ticker"] == "PETR4"
+
+    def test_parse_errors_are_raised_in_the_caller(
+        self, parse_pool: ParsePool, extractor: FundamentusStockExtractor
+    ):
+        with raises(Exception, match="not found on Fundamentus"):
+            parse_pool.parse(extractor, "XXXX3", load_page("detalhes_not_found.html"))
+
+    def test_scrape_translates_pool_errors(
+        self, parse_pool: ParsePool, extractor: FundamentusStockExtractor
+    ):
+        extractor.http_client.get.return_value = Mock(
+            text=load_page("detalhes_not_found.html")
+        )
+
+        with raises(Exception, match="Failed to scrape data for XXXX3"):
+            extractor.scrape("XXXX3", parse_pool)
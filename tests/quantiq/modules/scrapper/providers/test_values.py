@@ -0,0 +1,77 @@
+from datetime import UTC, datetime
+
+from pydantic import AliasChoices, BaseModel, Field
+from pytest import mark
+
+from quantiq.modules.scrapper.providers.values import (
+    parse_date,
+    parse_decimal,
+    parse_integer,
+    parse_text,
+    parse_value,
+    schema_parsers,
+)
+
+
+class Nested(BaseModel):
+    total: int | None = Field(alias=AliasChoices("receita", "receita_liquida"))
+
+
+class Model(BaseModel):
+    name: str = Field(alias="empresa")
+    price: float = Field(alias="cotacao")
+    updated_at: datetime = Field(alias="data_ult_cot")
+    nested: Nested
+    tags: list[str] = Field(default_factory=list)
+
+
+class TestValueParsers:
+    @mark.parametrize(
+        "value, expected",
+        [
+            ("", None),
+            ("-", None),
+            ("17/10/2025", "2025-10-17T00:00:00Z"),
+            ("-4,81%", -4.81),
+            ("38,52", 38.52),
+            ("1.254.367.000", 1254367000),
+            ("-123", -123.0),
+            ("PETROBRAS PN", "PETROBRAS PN"),
+            ("12,3,4", "12,3,4"),
+        ],
+    )
+    def test_parse_value(self, value, expected):
+        assert parse_value(value) == expected
+
+    def test_parse_text(self):
+        assert parse_text("PN N2") == "PN N2"
+        assert parse_text("-") is None
+
+    def test_parse_integer(self):
+        assert parse_integer("1.254.367.000") == 1254367000
+        assert parse_integer("-316.570") == -316570
+        assert parse_integer("-") is None
+        assert parse_integer("1,5") == 1.5
+
+    def test_parse_decimal(self):
+        assert parse_decimal("-35,10") == -35.1
+        assert parse_decimal("8,45%") == 8.45
+        assert parse_decimal("1.234,5") == 1234.5
+        assert parse_decimal("") is None
+        assert parse_decimal("n/a") == "n/a"
+
+    def test_parse_date(self):
+        assert parse_date("17/10/2025") == datetime(2025, 10, 17, tzinfo=UTC)
+        assert parse_date("-") is None
+        assert parse_date("31/02/2025") == "31/02/2025"
+
+    def test_schema_parsers(self):
+        parsers = schema_parsers(Model)
+
+        assert parsers == {
+            "empresa": parse_text,
+            "cotacao": parse_decimal,
+            "data_ult_cot": parse_date,
+            "receita": parse_integer,
+            "receita_liquida": parse_integer,
+        }
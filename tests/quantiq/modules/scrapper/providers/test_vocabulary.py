@@ -0,0 +1,61 @@
+from quantiq.modules.scrapper.providers.fundamentus.data import AssetType
+from quantiq.modules.scrapper.providers.fundamentus.vocabulary import (
+    DETAIL_LABELS,
+    REIT_VOCABULARY,
+    SCREENER_VOCABULARY,
+    STOCK_VOCABULARY,
+)
+from quantiq.modules.scrapper.providers.page import Page
+from quantiq.modules.scrapper.providers.vocabulary import (
+    compile_vocabulary,
+    label_to_key,
+    to_snake_case,
+)
+from tests.faker.pages import load_page
+
+
+class TestVocabulary:
+    def test_to_snake_case(self):
+        assert to_snake_case("Marg. Líquida") == "marg_liquida"
+        assert to_snake_case("Vol $ méd (2m)") == "vol_med_2m"
+        assert to_snake_case("") == ""
+
+    def test_label_to_key_strips_help_marker(self):
+        assert label_to_key("?Div Br/ Patrim") == "div_br_patrim"
+        assert label_to_key("") == ""
+
+    def test_compile_vocabulary_registers_help_marker_variant(self):
+        vocabulary = compile_vocabulary(["P/L", "Ativo"], {"ativo": "ativos"})
+
+        assert vocabulary == {
+            "P/L": "p_l",
+            "?P/L": "p_l",
+            "Ativo": "ativos",
+            "?Ativo": "ativos",
+        }
+
+    def test_reit_vocabulary_matches_slow_path(self):
+        for label in DETAIL_LABELS:
+            assert REIT_VOCABULARY[f"?{label}"] == label_to_key(label)
+
+    def test_stock_vocabulary_renames_abbreviated_labels(self):
+        assert STOCK_VOCABULARY["?Ativo"] == "ativos"
+        assert STOCK_VOCABULARY["?Patrim. Líq"] == "patrim_liquido"
+        assert STOCK_VOCABULARY["?EBIT / Ativo"] == "ebit_ativo"
+
+    def test_screener_vocabulary_uses_detail_keys(self):
+        assert SCREENER_VOCABULARY[AssetType.STOCK]["Mrg. Líq."] == "marg_liquida"
+        assert SCREENER_VOCABULARY[AssetType.REIT]["Liquidez"] == "vol_med_2m"
+
+    def test_recorded_pages_only_use_known_labels(self):
+        for name in ("detalhes_petr4.html", "detalhes_hglg11.html"):
+            page = Page.from_html(load_page(name))
+            labels = {
+                cell
+                for table in page.tables
+                for row in table.rows
+                for cell in row
+                if cell.startswith("?")
+            }
+
+            assert labels <= REIT_VOCABULARY.keys()
@@ -0,0 +1,65 @@
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from pydantic_core import to_jsonable_python
+from pytest import fixture
+
+from quantiq.core.infra.archive.page_archive import PageArchive
+from quantiq.modules.assets.domains.assets import Asset
+from quantiq.modules.assets.services.asset_service import AssetService
+from quantiq.modules.scrapper.replay.replay import main, replay
+from tests.faker.pages import load_expected, load_page
+
+
+class TestReplay:
+    @fixture
+    def archive(self, tmp_path: Path) -> PageArchive:
+        archive = PageArchive(tmp_path / "archive")
+        archive.put("stocks", "PETR4", load_page("detalhes_not_found.html"))
+        archive.put("stocks", "PETR4", load_page("detalhes_petr4.html"))
+        archive.put("reits", "HGLG11", load_page("detalhes_hglg11.html"))
+        archive.put("stocks", "XXXX3", load_page("detalhes_not_found.html"))
+        return archive
+
+    @fixture
+    def asset_service(self) -> Mock:
+        asset_service = Mock(spec=AssetService)
+        asset_service.insert_assets.side_effect = lambda data: {
+            item["ticker"]: Mock(spec=Asset) for item in data
+        }
+        return asset_service
+
+    def test_replays_latest_pages_without_fetching(
+        self, archive: PageArchive, asset_service: Mock
+    ):
+        with patch("requests.Session.get") as mock_get:
+            report = replay(archive, asset_service)
+
+        mock_get.assert_not_called()
+        assert report.model_dump() == {
+            "pages": 3,
+            "parsed": 2,
+            "failed": 1,
+            "persisted": 2,
+        }
+        (payloads,) = asset_service.insert_assets.call_args.args
+        assert to_jsonable_python(payloads) == [
+            load_expected("detalhes_petr4"),
+            load_expected("detalhes_hglg11"),
+        ]
+
+    def test_replays_every_fetch_in_a_process_pool(self, archive: PageArchive):
+        report = replay(archive, None, type="stocks", latest=False, workers=2)
+
+        assert (report.pages, report.parsed, report.failed) == (3, 1, 2)
+        assert report.persisted == 0
+
+    def test_main_dry_run(self, archive: PageArchive, capsys):
+        with patch(
+            "quantiq.modules.scrapper.replay.replay.get_page_archive",
+            return_value=archive,
+        ):
+            code = main(["--type", "reits", "--dry-run"])
+
+        assert code == 0
+        assert '"parsed": 1' in capsys.readouterr().out
@@ -0,0 +1,159 @@
+from pathlib import Path
+from typing import Any
+from unittest.mock import Mock
+
+from pytest import fixture, mark, raises
+import requests
+
+from quantiq.core.infra.archive.page_archive import PageArchive
+from quantiq.core.infra.cache.ttl_cache import TTLCache
+from quantiq.core.infra.http.client import HttpClient
+from quantiq.core.infra.http.retry import is_upstream_failure
+from quantiq.core.infra.resilience.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+)
+from quantiq.modules.scrapper.providers.fundamentus.data import AssetType
+from quantiq.modules.scrapper.providers.parse_pool import ParsePool
+from quantiq.modules.scrapper.providers.scrapper import Scrapper
+from quantiq.modules.scrapper.strategies.extractor import ExtractorStrategy
+
+
+class FakeScrapper(Scrapper):
+    base_url = "https://example.com/detalhes.php"
+
+    def parse(self, ticker: str, html: str) -> dict[str, Any]:
+        return {"ticker": ticker, "html": html}
+
+
+class TestExtractorStrategy:
+    @fixture
+    def http_client(self) -> Mock:
+        http_client = Mock(spec=HttpClient)
+        http_client.get.return_value = Mock(text="<html>sync</html>")
+        http_client.get_async.return_value = Mock(text="<html>async</html>")
+        return http_client
+
+    @fixture
+    def extractor(self, http_client: Mock) -> ExtractorStrategy:
+        extractor = ExtractorStrategy()
+        extractor.strategy = set()
+        extractor.set_strategy(FakeScrapper(AssetType.STOCK, http_client))
+        return extractor
+
+    def test_execute(self, extractor: ExtractorStrategy, http_client: Mock):
+        data = extractor.execute(AssetType.STOCK, "PETR4")
+        assert data == {"ticker": "PETR4", "html": "<html>sync</html>"}
+        http_client.get.assert_called_once_with(
+            "https://example.com/detalhes.php", params={"papel": "PETR4"}
+        )
+
+    @mark.asyncio
+    async def test_execute_async(self, extractor: ExtractorStrategy, http_client: Mock):
+        data = await extractor.execute_async(AssetType.STOCK, "PETR4")
+        assert data == {"ticker": "PETR4", "html": "<html>async</html>"}
+        http_client.get_async.assert_awaited_once_with(
+            "https://example.com/detalhes.php", params={"papel": "PETR4"}
+        )
+
+    @mark.asyncio
+    async def test_execute_async_invalid_type(self, extractor: ExtractorStrategy):
+        with raises(ValueError):
+            await extractor.execute_async(AssetType.REIT, "HGLG11")
+
+    def test_execute_with_parse_pool(self, extractor: ExtractorStrategy):
+        parse_pool = Mock(spec=ParsePool)
+        parse_pool.parse.return_value = {"ticker": "PETR4"}
+        extractor.set_parse_pool(parse_pool)
+
+        assert extractor.execute(AssetType.STOCK, "PETR4") == {"ticker": "PETR4"}
+        scrapper, ticker, html = parse_pool.parse.call_args.args
+        assert isinstance(scrapper, FakeScrapper)
+        assert (ticker, html) == ("PETR4", "<html>sync</html>")
+
+    @mark.asyncio
+    async def test_execute_async_with_parse_pool(self, extractor: ExtractorStrategy):
+        parse_pool = Mock(spec=ParsePool)
+        parse_pool.parse_async.return_value = {"ticker": "PETR4"}
+        extractor.set_parse_pool(parse_pool)
+
+        data = await extractor.execute_async(AssetType.STOCK, "PETR4")
+
+        assert data == {"ticker": "PETR4"}
+        parse_pool.parse_async.assert_awaited_once()
+
+    def test_execute_reuses_cached_payloads(
+        self, extractor: ExtractorStrategy, http_client: Mock
+    ):
+        extractor.set_cache(TTLCache(ttl_seconds=60, max_entries=10, max_bytes=4096))
+
+        first = extractor.execute(AssetType.STOCK, "PETR4")
+        second = extractor.execute(AssetType.STOCK, "petr4")
+
+        assert first == second
+        http_client.get.assert_called_once()
+
+    @mark.asyncio
+    async def test_execute_async_reuses_cached_payloads(
+        self, extractor: ExtractorStrategy, http_client: Mock
+    ):
+        extractor.set_cache(TTLCache(ttl_seconds=60, max_entries=10, max_bytes=4096))
+
+        await extractor.execute_async(AssetType.STOCK, "PETR4")
+        await extractor.execute_async(AssetType.STOCK, "PETR4")
+
+        http_client.get_async.assert_awaited_once()
+
+    def test_execute_fails_fast_while_circuit_is_open(
+        self, extractor: ExtractorStrategy, http_client: Mock
+    ):
+        extractor.set_circuit_breaker(
+            CircuitBreaker(
+                "Fundamentus",
+                failure_threshold=2,
+                reset_timeout=60,
+                is_failure=is_upstream_failure,
+            )
+        )
+        http_client.get.side_effect = requests.ConnectionError("refused")
+
+        for _ in range(2):
+            with raises(requests.ConnectionError):
+                extractor.execute(AssetType.STOCK, "PETR4")
+        with raises(CircuitOpenError):
+            extractor.execute(AssetType.STOCK, "VALE3")
+
+        assert http_client.get.call_count == 2
+
+    @mark.asyncio
+    async def test_execute_async_fails_fast_while_circuit_is_open(
+        self, extractor: ExtractorStrategy, http_client: Mock
+    ):
+        extractor.set_circuit_breaker(
+            CircuitBreaker("Fundamentus", failure_threshold=1, reset_timeout=60)
+        )
+        http_client.get_async.side_effect = requests.ReadTimeout("slow")
+
+        with raises(requests.ReadTimeout):
+            await extractor.execute_async(AssetType.STOCK, "PETR4")
+        with raises(CircuitOpenError):
+            await extractor.execute_async(AssetType.STOCK, "PETR4")
+
+        http_client.get_async.assert_awaited_once()
+
+    @mark.asyncio
+    async def test_execute_archives_fetched_pages(
+        self, extractor: ExtractorStrategy, tmp_path: Path
+    ):
+        archive = PageArchive(tmp_path)
+        extractor.set_archive(archive)
+
+        extractor.execute(AssetType.STOCK, "PETR4")
+        await extractor.execute_async(AssetType.STOCK, "VALE3")
+
+        pages = list(archive.pages())
+        assert [(page.type, page.ticker) for page in pages] == [
+            ("stocks", "PETR4"),
+            ("stocks", "VALE3"),
+        ]
+        assert archive.read(pages[1]) == "<html>async</html>"